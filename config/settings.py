@@ -116,6 +116,10 @@ BROWSER_POOL_SIZE = _get_int('BROWSER_POOL_SIZE', 3)  # 3 persistent browser ins
 # Async refactor with browser pool integration (Sprint 2.2)
 USE_BROWSER_POOL = _get_bool('USE_BROWSER_POOL', False)  # Safe default - native async with browser pooling
 
+# Async email validation (Phase 3 - shared connection pool, concurrent API calls)
+ENABLE_ASYNC_EMAIL_VALIDATION = _get_bool('ENABLE_ASYNC_EMAIL_VALIDATION', False)  # Opt-in
+EMAIL_VALIDATION_CONCURRENCY = _get_int('EMAIL_VALIDATION_CONCURRENCY', 10)  # In-flight validation requests
+
 # Timeouts
 REQUEST_TIMEOUT = _get_int('REQUEST_TIMEOUT', 30)
 
@@ -135,6 +139,7 @@ MIN_CONFIDENCE_SCORE = _get_int('MIN_CONFIDENCE_SCORE', 50)
 MIN_EMAIL_SCORE = _get_int('MIN_EMAIL_SCORE', 70)
 ENABLE_CACHING = _get_bool('ENABLE_CACHING', True)
 CACHE_EXPIRATION_HOURS = _get_int('CACHE_EXPIRATION_HOURS', 24)
+EXCEL_ENGINE = os.getenv('EXCEL_ENGINE', 'openpyxl').lower()  # 'openpyxl' or 'xlsxwriter'
 
 # =============================================================================
 # Target Roles (for title matching)
@@ -380,6 +385,7 @@ __all__ = [
     'MIN_EMAIL_SCORE',
     'ENABLE_CACHING',
     'CACHE_EXPIRATION_HOURS',
+    'EXCEL_ENGINE',
     'LAW_SCHOOL_ROLES',
     'PARALEGAL_PROGRAM_ROLES',
     'ALL_TARGET_ROLES',
@@ -346,6 +346,9 @@ def main():
             print("=" * 70)
             print()
 
+            # Write out contacts and completions still buffered since the last checkpoint
+            streaming_writer.checkpoint()
+
             if progressive_csv.exists():
                 logger.info(f"Loading {streaming_writer.contacts_written} contacts from {progressive_csv}")
                 contacts = pd.read_csv(progressive_csv)
@@ -468,9 +471,9 @@ def main():
 
             # Email validation stats (if Phase 3 completed)
             if 'email_status' in contacts.columns:
-                validated = len(contacts[contacts['email_status'].isin(['valid', 'deliverable'])])
-                catchall = len(contacts[contacts['email_is_catchall'] == True])
-                invalid = len(contacts[contacts['email_status'].isin(['invalid', 'undeliverable'])])
+                validated = int(contacts['email_status'].isin(['valid', 'deliverable']).sum())
+                catchall = int(contacts['email_is_catchall'].fillna(False).astype(bool).sum())
+                invalid = int(contacts['email_status'].isin(['invalid', 'undeliverable']).sum())
 
                 print("Email Quality:")
                 if emails_found > 0:
@@ -14,6 +14,7 @@ Sprint: 1.2
 
 import requests
 from bs4 import BeautifulSoup
+from lxml import html as lxml_html
 import pandas as pd
 from typing import List, Dict, Optional
 import re
@@ -27,49 +28,162 @@ from config.settings import RATE_LIMIT_DELAY, CACHE_DIR
 # Initialize logger
 logger = setup_logger("aafpe_scraper")
 
+# Arrow-backed strings are optional - fall back to object dtype without pyarrow
+try:
+    import pyarrow  # noqa: F401
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 # User agent for requests
 USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
 
-
-def get_user_agent() -> str:
-    """Get user agent string for requests."""
-    return USER_AGENT
+# Request headers built once at import - nothing here varies per fetch
+_HEADERS = {
+    'User-Agent': USER_AGENT,
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Connection': 'keep-alive',
+}
 
 # Configuration
 AAFPE_URL = "https://aafpe.org/memberschoools"
 CACHE_FILE = Path(CACHE_DIR) / "aafpe_programs.json"
 CACHE_DURATION = timedelta(hours=24)  # 24-hour cache
+# Bump whenever the parser or program record layout changes so caches
+# written by older code are discarded instead of silently reused
+CACHE_SCHEMA = 2
 
+# Section headings on the directory page that are not states
+SKIP_SECTIONS = frozenset(['other', 'non-member', 'organizations'])
 
-def fetch_aafpe_page() -> Optional[BeautifulSoup]:
+# Low-cardinality columns stored as pandas categoricals (~50 states, 1 type)
+CATEGORICAL_COLUMNS = ['state', 'program_type']
+
+
+def fetch_aafpe_html() -> Optional[bytes]:
     """
-    Fetch the AAfPE member schools directory page.
+    Fetch the raw HTML of the AAfPE member schools directory page.
 
     Returns:
-        BeautifulSoup object or None if fetch fails
+        Response body bytes or None if fetch fails
     """
     try:
         logger.info(f"Fetching AAfPE member schools directory: {AAFPE_URL}")
 
-        headers = {
-            'User-Agent': get_user_agent(),
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
-        }
-
-        response = requests.get(AAFPE_URL, headers=headers, timeout=30)
+        response = requests.get(AAFPE_URL, headers=_HEADERS, timeout=30)
         response.raise_for_status()
 
         logger.success(f"Successfully fetched AAfPE page ({len(response.content)} bytes)")
-        return BeautifulSoup(response.content, 'html.parser')
+        return response.content
 
     except requests.RequestException as e:
         logger.error(f"Failed to fetch AAfPE page: {e}")
         return None
 
 
+def fetch_aafpe_page() -> Optional[BeautifulSoup]:
+    """
+    Fetch the AAfPE member schools directory page.
+
+    Returns:
+        BeautifulSoup object or None if fetch fails
+    """
+    content = fetch_aafpe_html()
+    if content is None:
+        return None
+    return BeautifulSoup(content, 'html.parser')
+
+
+def _build_program(state_name: str, program_name: str, program_url: str) -> Optional[Dict[str, str]]:
+    """
+    Normalize one directory link into a program record.
+
+    Args:
+        state_name: State section heading the link appears under
+        program_name: Link text
+        program_url: Link href
+
+    Returns:
+        Program dictionary or None if the link has no name
+    """
+    program_name = program_name.strip()
+    program_url = program_url.strip()
+
+    # Skip empty entries
+    if not program_name:
+        return None
+
+    # Validate and normalize URL
+    if program_url and not program_url.startswith('http'):
+        if program_url.startswith('//'):
+            program_url = 'https:' + program_url
+        elif program_url.startswith('/'):
+            program_url = 'https://aafpe.org' + program_url
+        else:
+            program_url = 'https://' + program_url
+
+    # Clean up program name (remove extra whitespace)
+    program_name = re.sub(r'\s+', ' ', program_name).strip()
+
+    return {
+        'name': program_name,
+        'url': program_url or '',
+        'state': state_name,
+        'program_type': 'paralegal'
+    }
+
+
+def parse_h2_ul_directory(content: bytes) -> List[Dict[str, str]]:
+    """
+    Parse an h2/ul/a directory page straight from HTML bytes.
+
+    Same output as parse_state_sections(), but walks lxml's C-level tree
+    instead of building a BeautifulSoup object, which dominates parse time
+    on large directory pages. Works for any directory laid out as
+    <h2>State</h2><ul><li><a href=...>Program</a></li></ul>.
+
+    Args:
+        content: Raw page HTML
+
+    Returns:
+        List of program dictionaries (see parse_state_sections)
+    """
+    programs = []
+
+    if not content:
+        return programs
+
+    root = lxml_html.fromstring(content)
+    state_headers = list(root.iter('h2'))
+
+    logger.info(f"Found {len(state_headers)} state sections")
+
+    for header in state_headers:
+        state_name = header.text_content().strip()
+
+        # Skip non-state sections (like "Other")
+        if state_name.lower() in SKIP_SECTIONS:
+            logger.debug(f"Skipping non-state section: {state_name}")
+            continue
+
+        # Find the next ul element (sibling of h2)
+        ul_lists = header.xpath('following-sibling::ul[1]')
+
+        if not ul_lists:
+            logger.warning(f"No program list found for state: {state_name}")
+            continue
+
+        for link in ul_lists[0].iter('a'):
+            program = _build_program(state_name, link.text_content(), link.get('href', ''))
+            if program:
+                programs.append(program)
+
+    logger.success(f"Extracted {len(programs)} paralegal programs from AAfPE directory")
+    return programs
+
+
 def parse_state_sections(soup: BeautifulSoup) -> List[Dict[str, str]]:
     """
     Parse state-organized program sections from AAfPE directory.
@@ -101,7 +215,7 @@ def parse_state_sections(soup: BeautifulSoup) -> List[Dict[str, str]]:
         state_name = header.get_text().strip()
 
         # Skip non-state sections (like "Other")
-        if state_name.lower() in ['other', 'non-member', 'organizations']:
+        if state_name.lower() in SKIP_SECTIONS:
             logger.debug(f"Skipping non-state section: {state_name}")
             continue
 
@@ -116,38 +230,43 @@ def parse_state_sections(soup: BeautifulSoup) -> List[Dict[str, str]]:
         program_links = ul_list.find_all('a')
 
         for link in program_links:
-            program_name = link.get_text().strip()
-            program_url = link.get('href', '').strip()
-
-            # Skip empty entries
-            if not program_name:
+            program = _build_program(state_name, link.get_text(), link.get('href', ''))
+            if not program:
                 continue
 
-            # Validate and normalize URL
-            if program_url and not program_url.startswith('http'):
-                if program_url.startswith('//'):
-                    program_url = 'https:' + program_url
-                elif program_url.startswith('/'):
-                    program_url = 'https://aafpe.org' + program_url
-                else:
-                    program_url = 'https://' + program_url
-
-            # Clean up program name (remove extra whitespace)
-            program_name = re.sub(r'\s+', ' ', program_name).strip()
-
-            programs.append({
-                'name': program_name,
-                'url': program_url or '',
-                'state': state_name,
-                'program_type': 'paralegal'
-            })
-
-            logger.debug(f"  [{state_name}] {program_name}")
+            programs.append(program)
+            logger.debug(f"  [{state_name}] {program['name']}")
 
     logger.success(f"Extracted {len(programs)} paralegal programs from AAfPE directory")
     return programs
 
 
+def programs_to_dataframe(programs: List[Dict[str, str]]) -> pd.DataFrame:
+    """
+    Build the programs DataFrame with compact column dtypes.
+
+    state/program_type become categoricals so value_counts, groupby and isin
+    filters compare integer codes instead of Python strings. name/url use
+    Arrow-backed strings when pyarrow is installed.
+
+    Args:
+        programs: List of program dictionaries
+
+    Returns:
+        DataFrame with columns: name, url, state, program_type
+    """
+    df = pd.DataFrame(programs, columns=['name', 'url', 'state', 'program_type'])
+
+    for column in CATEGORICAL_COLUMNS:
+        df[column] = df[column].astype('category')
+
+    if PYARROW_AVAILABLE:
+        for column in ['name', 'url']:
+            df[column] = df[column].astype('string[pyarrow]')
+
+    return df
+
+
 def save_to_cache(programs: List[Dict[str, str]]) -> None:
     """
     Save programs to cache file with timestamp.
@@ -157,6 +276,7 @@ def save_to_cache(programs: List[Dict[str, str]]) -> None:
     """
     try:
         cache_data = {
+            'schema': CACHE_SCHEMA,
             'timestamp': datetime.now().isoformat(),
             'programs': programs,
             'count': len(programs)
@@ -175,10 +295,11 @@ def save_to_cache(programs: List[Dict[str, str]]) -> None:
 
 def load_from_cache() -> Optional[List[Dict[str, str]]]:
     """
-    Load programs from cache if available and not expired.
+    Load programs from cache if available, not expired and written with the
+    current CACHE_SCHEMA.
 
     Returns:
-        List of program dictionaries or None if cache invalid/expired
+        List of program dictionaries or None if cache invalid/expired/stale
     """
     try:
         if not CACHE_FILE.exists():
@@ -188,6 +309,11 @@ def load_from_cache() -> Optional[List[Dict[str, str]]]:
         with open(CACHE_FILE, 'r') as f:
             cache_data = json.load(f)
 
+        # Check cache was written by a compatible parser version
+        if cache_data.get('schema') != CACHE_SCHEMA:
+            logger.info(f"Cache schema mismatch (found {cache_data.get('schema')}, expected {CACHE_SCHEMA})")
+            return None
+
         # Check cache age
         cache_time = datetime.fromisoformat(cache_data['timestamp'])
         cache_age = datetime.now() - cache_time
@@ -233,33 +359,33 @@ def scrape_aafpe_programs(use_cache: bool = True) -> pd.DataFrame:
     if use_cache:
         cached_programs = load_from_cache()
         if cached_programs:
-            return pd.DataFrame(cached_programs)
+            return programs_to_dataframe(cached_programs)
 
     # Fetch and parse
-    soup = fetch_aafpe_page()
+    content = fetch_aafpe_html()
 
-    if not soup:
+    if not content:
         logger.error("Failed to fetch AAfPE page - returning empty DataFrame")
-        return pd.DataFrame(columns=['name', 'url', 'state', 'program_type'])
+        return programs_to_dataframe([])
 
-    # Parse programs
-    programs = parse_state_sections(soup)
+    # Parse programs directly from bytes (no BeautifulSoup tree)
+    programs = parse_h2_ul_directory(content)
 
     if not programs:
         logger.warning("No programs extracted from AAfPE page")
-        return pd.DataFrame(columns=['name', 'url', 'state', 'program_type'])
+        return programs_to_dataframe([])
 
     # Save to cache
     save_to_cache(programs)
 
-    # Convert to DataFrame
-    df = pd.DataFrame(programs)
+    # Convert to DataFrame (categorical state/program_type)
+    df = programs_to_dataframe(programs)
 
     # Log summary
     logger.info("\nSummary:")
     logger.info(f"  Total programs: {len(df)}")
     logger.info(f"  States covered: {df['state'].nunique()}")
-    logger.info(f"  Programs with URLs: {df['url'].astype(bool).sum()}")
+    logger.info(f"  Programs with URLs: {(df['url'] != '').sum()}")
 
     # Top 5 states by program count
     logger.info("\nTop 5 states by program count:")
@@ -10,10 +10,160 @@ Date: 2025-12-29
 """
 
 import re
-from typing import List, Set, Optional
-from bs4 import BeautifulSoup
+from functools import lru_cache
+from typing import Dict, Iterable, List, Set, Optional
+from bs4 import BeautifulSoup, Tag
 from loguru import logger
 
+# Optional: google-re2 scans for every obfuscation marker in one DFA pass
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+
+# Compiled once at import - these run on every scraped page.
+# Bounded quantifiers and dot-separated domain labels keep matching linear on
+# adversarial input (e.g. "a@a.comcomcom...") scraped from untrusted pages.
+_EMAIL_PATTERN = (
+    r'[A-Za-z0-9._%+-]{1,64}@[A-Za-z0-9-]{1,63}(?:\.[A-Za-z0-9-]{1,63}){0,4}\.[A-Za-z]{2,24}'
+)
+_EMAIL_RE = re.compile(rf'\b{_EMAIL_PATTERN}\b')
+_EMAIL_FULL_RE = re.compile(rf'^{_EMAIL_PATTERN}$')
+_JS_SIMPLE_RE = re.compile(rf'["\']({_EMAIL_PATTERN})["\']')
+_JS_CONCAT_RE = re.compile(
+    r'["\']([a-z0-9._-]{1,64})["\']\s*\+\s*["\']@["\']\s*\+\s*["\']([a-z0-9-]{1,63}(?:\.[a-z0-9-]{1,63}){0,4}\.[a-z]{2,24})["\']',
+    re.IGNORECASE
+)
+
+# Script/noscript bodies are scanned straight from the raw HTML; they are only
+# fed to the email regexes, so no parsed text is needed
+_SCRIPT_BLOCK_RE = re.compile(r'<script\b[^>]*>(.*?)</script>', re.IGNORECASE | re.DOTALL)
+_NOSCRIPT_BLOCK_RE = re.compile(r'<noscript\b[^>]*>(.*?)</noscript>', re.IGNORECASE | re.DOTALL)
+
+
+# Obfuscated "@" and "." forms for the text marker. \W (not \s) pads them so the
+# marker also covers Unicode whitespace, which RE2's ASCII-only \s does not
+_AT_FORM = r'(?:\W*[\[(]at[\])]\W*|\W+at\W+)'
+_DOT_FORM = r'(?:\W*[\[(]dot[\])]\W*|\W+dot\W+)'
+
+# Cheap per-decoder markers: a decoder can only find something when its marker
+# occurs somewhere in the page (matched case-insensitively). The text marker
+# needs an email shape: word, at-form, word, then "." or a dot-form - or a
+# dot-form inside an address that already has a literal "@"
+_MARKER_PATTERNS = {
+    'cloudflare': r'data-cfemail',
+    'text': (
+        rf'\w{_AT_FORM}\w[\w-]*(?:\.|{_DOT_FORM})\w'
+        rf'|[\w.%+-]{_DOT_FORM}[\w.%+-]*@'
+        rf'|@[\w.-]*[\w-]{_DOT_FORM}\w'
+    ),
+    'javascript': r'<script',
+    'noscript': r'<noscript',
+    'attributes': r'data-(?:email|contact|mail|user-email)',
+}
+_MARKER_NAMES = list(_MARKER_PATTERNS)
+_NON_TEXT_MARKERS = frozenset(_MARKER_NAMES) - {'text'}
+_SOUP_MARKERS = frozenset(['cloudflare', 'attributes'])
+
+
+def _build_marker_set():
+    """Compile _MARKER_PATTERNS into a single unanchored RE2 set."""
+    options = re2.Options()
+    options.case_sensitive = False
+    marker_set = re2.Set.SearchSet(options)
+    for pattern in _MARKER_PATTERNS.values():
+        marker_set.Add(pattern)
+    marker_set.Compile()
+    return marker_set
+
+
+_MARKER_SET = _build_marker_set() if RE2_AVAILABLE else None
+
+
+# Without re2, still pre-check the text markers: most pages contain none, and
+# one search is far cheaper than the substitution pass plus findall
+_TEXT_MARKER_RE = re.compile(_MARKER_PATTERNS['text'], re.IGNORECASE)
+
+
+def _find_markers(html: str) -> frozenset:
+    """
+    Return the names of decoders whose markers appear in html.
+
+    Without google-re2 only the text-pattern marker is checked (with the
+    standard re module); every other decoder is reported and runs.
+    """
+    if _MARKER_SET is None:
+        if _TEXT_MARKER_RE.search(html):
+            return frozenset(_MARKER_NAMES)
+        return _NON_TEXT_MARKERS
+    return frozenset(_MARKER_NAMES[i] for i in _MARKER_SET.Match(html) or ())
+
+
+@lru_cache(maxsize=256)
+def _xor_table(key: int) -> bytes:
+    """256-entry bytes.translate table that XORs every byte with key."""
+    return bytes(i ^ key for i in range(256))
+
+
+@lru_cache(maxsize=1024)
+def _decode_cfemail(encoded: str) -> str:
+    """
+    Decode a data-cfemail hex string (first byte is the XOR key).
+
+    bytes.fromhex plus one translate call is the cheapest pure-Python
+    route; cached because sites repeat the same protected address in
+    headers, footers and contact blocks.
+
+    Raises:
+        ValueError: If encoded is not valid hex
+    """
+    encoded_bytes = bytes.fromhex(encoded)
+    return encoded_bytes[1:].translate(_xor_table(encoded_bytes[0])).decode('latin-1')
+
+
+# Placeholder addresses that show up in templates and forms
+_FALSE_POSITIVES = frozenset([
+    'email@example.com',
+    'user@example.com',
+    'admin@example.com',
+    'info@example.com',
+    'test@test.com',
+    'example@example.com'
+])
+
+
+@lru_cache(maxsize=8192)
+def _is_valid_email(email: str) -> bool:
+    """
+    Cached email format check shared by all EmailDeobfuscator instances.
+
+    Pages repeat the same candidates many times, so hits skip the regex.
+    """
+    # RFC 5321 caps addresses at 254 characters
+    if not email or len(email) < 5 or len(email) > 254:
+        return False
+
+    # Cheap structural rejects before the regex: exactly one '@' with a
+    # local part, and a dot in the domain followed by a 2+ char TLD
+    at = email.find('@')
+    if at < 1 or at != email.rfind('@'):
+        return False
+    dot = email.rfind('.')
+    if dot < at + 2 or len(email) - dot < 3:
+        return False
+
+    # Basic email regex
+    if not _EMAIL_FULL_RE.match(email):
+        return False
+
+    # Exclude common false positives
+    if email.lower() in _FALSE_POSITIVES:
+        return False
+
+    return True
+
 
 class EmailDeobfuscator:
     """
@@ -27,19 +177,26 @@ class EmailDeobfuscator:
     - <noscript> fallbacks
     """
 
-    # Text pattern variations
-    TEXT_PATTERNS = [
-        # email [at] domain [dot] com
-        (r'(\w+(?:\.\w+)*)\s*\[at\]\s*(\w+(?:\.\w+)*)', r'\1@\2'),
-        # email (at) domain (dot) com
-        (r'(\w+(?:\.\w+)*)\s*\(at\)\s*(\w+(?:\.\w+)*)', r'\1@\2'),
-        # email AT domain DOT com
-        (r'(\w+(?:\.\w+)*)\s+AT\s+(\w+(?:\.\w+)*)', r'\1@\2'),
-        # Replace [dot] and (dot)
-        (r'\[dot\]', '.'),
-        (r'\(dot\)', '.'),
-        (r'\s+DOT\s+', '.'),
-    ]
+    # Text pattern variations, folded into one alternation so the page is
+    # scanned once instead of once per pattern:
+    # - email [at] domain / email (at) domain / email AT domain
+    # - [dot], (dot) and " DOT " become "." (any case, e.g. "[DOT]", which is
+    #   why these stay in the regex rather than chained str.replace calls)
+    TEXT_OBFUSCATION_RE = re.compile(
+        r'(?P<user>\w+(?:\.\w+)*)(?:\s*\[at\]\s*|\s*\(at\)\s*|\s+AT\s+)(?P<domain>\w+(?:\.\w+)*)'
+        r'|(?P<dot>\[dot\]|\(dot\)|\s+DOT\s+)',
+        re.IGNORECASE
+    )
+
+    # Custom data attributes some sites store plain emails in
+    EMAIL_ATTRIBUTES = ('data-email', 'data-contact', 'data-mail', 'data-user-email')
+
+    @staticmethod
+    def _replace_obfuscation(match: re.Match) -> str:
+        """Substitution callback for TEXT_OBFUSCATION_RE."""
+        if match.group('dot') is not None:
+            return '.'
+        return f"{match.group('user')}@{match.group('domain')}"
 
     def __init__(self):
         """Initialize email de-obfuscator."""
@@ -66,73 +223,97 @@ class EmailDeobfuscator:
         if not html:
             return emails
 
-        soup = BeautifulSoup(html, 'html.parser')
+        # One pass over the page decides which decoders can match at all
+        markers = _find_markers(html)
+
+        # lxml parser is roughly 10x faster than the pure-Python html.parser;
+        # skip parsing entirely when no soup-based decoder has work to do
+        if markers & _SOUP_MARKERS:
+            soup = BeautifulSoup(html, 'lxml')
+            elements = self._classify_elements(soup)
+        else:
+            elements = dict.fromkeys(_SOUP_MARKERS, [])
 
         # 1. Cloudflare protection
-        cloudflare_emails = self._decode_cloudflare(soup)
-        emails.update(cloudflare_emails)
+        if 'cloudflare' in markers:
+            emails.update(self._decode_cloudflare(elements['cloudflare']))
 
         # 2. Text pattern deobfuscation
-        text_emails = self._decode_text_patterns(html)
-        emails.update(text_emails)
+        if 'text' in markers:
+            emails.update(self._decode_text_patterns(html))
 
         # 3. JavaScript extraction
-        js_emails = self._extract_from_javascript(soup)
-        emails.update(js_emails)
+        if 'javascript' in markers:
+            scripts = (m.group(1) for m in _SCRIPT_BLOCK_RE.finditer(html))
+            emails.update(self._extract_from_javascript(scripts))
 
         # 4. Noscript fallbacks
-        noscript_emails = self._extract_from_noscript(soup)
-        emails.update(noscript_emails)
+        if 'noscript' in markers:
+            blocks = (m.group(1) for m in _NOSCRIPT_BLOCK_RE.finditer(html))
+            emails.update(self._extract_from_noscript(blocks))
 
         # 5. Data attributes (data-email, data-contact, etc.)
-        attr_emails = self._extract_from_attributes(soup)
-        emails.update(attr_emails)
+        if 'attributes' in markers:
+            emails.update(self._extract_from_attributes(elements['attributes']))
 
         if emails:
             self.stats['total_deobfuscated'] += len(emails)
-            logger.debug(f"De-obfuscated {len(emails)} email addresses")
+            logger.debug("De-obfuscated {} email addresses", len(emails))
 
         return emails
 
-    def _decode_cloudflare(self, soup: BeautifulSoup) -> Set[str]:
+    def _classify_elements(self, soup: BeautifulSoup) -> Dict[str, List[Tag]]:
+        """
+        Bucket the elements each decoder needs in a single tree walk.
+
+        Args:
+            soup: Parsed page
+
+        Returns:
+            Dict keyed by decoder name ('cloudflare', 'attributes') with the
+            matching elements
+        """
+        elements = {name: [] for name in _SOUP_MARKERS}
+
+        for element in soup.find_all(True):
+            attrs = element.attrs
+            if not attrs:
+                continue
+            if 'data-cfemail' in attrs:
+                elements['cloudflare'].append(element)
+            if any(attr in attrs for attr in self.EMAIL_ATTRIBUTES):
+                elements['attributes'].append(element)
+
+        return elements
+
+    def _decode_cloudflare(self, cf_elements: List[Tag]) -> Set[str]:
         """
         Decode Cloudflare email protection.
 
         Cloudflare uses data-cfemail attribute with XOR encoding.
         Algorithm: First byte is key, XOR with subsequent bytes.
+
+        Args:
+            cf_elements: Elements carrying a data-cfemail attribute
         """
         emails = set()
 
-        # Find all elements with data-cfemail attribute
-        cf_elements = soup.find_all(attrs={'data-cfemail': True})
-
         for element in cf_elements:
             encoded = element.get('data-cfemail', '')
             if not encoded:
                 continue
 
             try:
-                # Decode hex string
-                encoded_bytes = bytes.fromhex(encoded)
-
-                # First byte is the XOR key
-                key = encoded_bytes[0]
-
-                # XOR each subsequent byte with key
-                decoded_chars = []
-                for byte in encoded_bytes[1:]:
-                    decoded_chars.append(chr(byte ^ key))
-
-                email = ''.join(decoded_chars)
+                email = _decode_cfemail(encoded)
 
                 # Validate it looks like an email
                 if self._is_valid_email_format(email):
                     emails.add(email)
                     self.stats['cloudflare_decoded'] += 1
-                    logger.debug(f"Decoded Cloudflare email: {email}")
+                    logger.debug("Decoded Cloudflare email: {}", email)
 
             except Exception as e:
-                logger.debug(f"Failed to decode Cloudflare email: {e}")
+                logger.debug("Failed to decode Cloudflare email: {}", e)
 
         return emails
 
@@ -145,28 +326,20 @@ class EmailDeobfuscator:
         - email (at) domain (dot) com
         - email AT domain DOT com
         """
-        emails = set()
-
-        # Apply each pattern transformation
-        decoded_text = text
-        for pattern, replacement in self.TEXT_PATTERNS:
-            decoded_text = re.sub(pattern, replacement, decoded_text, flags=re.IGNORECASE)
+        # Apply all pattern transformations in a single pass
+        decoded_text = self.TEXT_OBFUSCATION_RE.sub(self._replace_obfuscation, text)
 
-        # Find email addresses in decoded text
-        email_regex = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        found_emails = re.findall(email_regex, decoded_text)
-
-        for email in found_emails:
-            if self._is_valid_email_format(email):
-                # Check if this email was actually obfuscated (not in original text)
-                if email not in text:
-                    emails.add(email)
-                    self.stats['text_pattern_decoded'] += 1
-                    logger.debug(f"Decoded text pattern email: {email}")
+        # Keep valid emails that were actually obfuscated (not in original text)
+        found = [
+            email for email in _EMAIL_RE.findall(decoded_text)
+            if self._is_valid_email_format(email) and email not in text
+        ]
+        self.stats['text_pattern_decoded'] += len(found)
+        logger.debug("Decoded {} text pattern emails", len(found))
 
-        return emails
+        return set(found)
 
-    def _extract_from_javascript(self, soup: BeautifulSoup) -> Set[str]:
+    def _extract_from_javascript(self, scripts: Iterable[str]) -> Set[str]:
         """
         Extract emails from JavaScript code.
 
@@ -174,62 +347,61 @@ class EmailDeobfuscator:
         - var email = "user@domain.com";
         - document.write("email@domain.com");
         - String concatenation: "user" + "@" + "domain.com"
+
+        Args:
+            scripts: Raw <script> bodies from the page
         """
         emails = set()
 
-        # Find all script tags
-        scripts = soup.find_all('script')
-
-        for script in scripts:
-            script_text = script.get_text()
+        for script_text in scripts:
             if not script_text:
                 continue
 
             # Pattern 1: Simple string literals containing @
-            simple_pattern = r'["\']([A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,})["\']'
-            found = re.findall(simple_pattern, script_text)
-            for email in found:
-                if self._is_valid_email_format(email):
-                    emails.add(email)
-                    self.stats['javascript_extracted'] += 1
+            found = [
+                email for email in _JS_SIMPLE_RE.findall(script_text)
+                if self._is_valid_email_format(email)
+            ]
 
             # Pattern 2: String concatenation (simplified)
             # Look for: "user" + "@" + "domain"
-            concat_pattern = r'["\']([a-z0-9._-]+)["\']\s*\+\s*["\']@["\']\s*\+\s*["\']([a-z0-9._-]+\.[a-z]{2,})["\']'
-            found = re.findall(concat_pattern, script_text, re.IGNORECASE)
-            for user, domain in found:
-                email = f"{user}@{domain}"
-                if self._is_valid_email_format(email):
-                    emails.add(email)
-                    self.stats['javascript_extracted'] += 1
+            found.extend(
+                email for email in (
+                    f"{user}@{domain}" for user, domain in _JS_CONCAT_RE.findall(script_text)
+                )
+                if self._is_valid_email_format(email)
+            )
+
+            emails.update(found)
+            self.stats['javascript_extracted'] += len(found)
 
         return emails
 
-    def _extract_from_noscript(self, soup: BeautifulSoup) -> Set[str]:
+    def _extract_from_noscript(self, noscript_blocks: Iterable[str]) -> Set[str]:
         """
         Extract emails from <noscript> fallback content.
 
         Many sites provide plain email in <noscript> for non-JS browsers.
+
+        Args:
+            noscript_blocks: Raw <noscript> bodies from the page
         """
         emails = set()
 
-        noscript_tags = soup.find_all('noscript')
-        for tag in noscript_tags:
-            text = tag.get_text()
-
+        for text in noscript_blocks:
             # Find emails in noscript content
-            email_regex = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-            found = re.findall(email_regex, text)
+            found = [
+                email for email in _EMAIL_RE.findall(text)
+                if self._is_valid_email_format(email)
+            ]
+            emails.update(found)
+            self.stats['noscript_extracted'] += len(found)
 
-            for email in found:
-                if self._is_valid_email_format(email):
-                    emails.add(email)
-                    self.stats['noscript_extracted'] += 1
-                    logger.debug(f"Extracted email from noscript: {email}")
+        logger.debug("Extracted {} emails from noscript", len(emails))
 
         return emails
 
-    def _extract_from_attributes(self, soup: BeautifulSoup) -> Set[str]:
+    def _extract_from_attributes(self, elements: List[Tag]) -> Set[str]:
         """
         Extract emails from data attributes.
 
@@ -238,19 +410,21 @@ class EmailDeobfuscator:
         - data-contact
         - data-mail
         - data-user-email
+
+        Args:
+            elements: Elements carrying at least one EMAIL_ATTRIBUTES attribute
         """
         emails = set()
 
-        # Common attribute names
-        attr_names = ['data-email', 'data-contact', 'data-mail', 'data-user-email']
+        for element in elements:
+            emails.update(
+                email for email in (
+                    element.get(attr, '').strip() for attr in self.EMAIL_ATTRIBUTES
+                )
+                if email and self._is_valid_email_format(email)
+            )
 
-        for attr in attr_names:
-            elements = soup.find_all(attrs={attr: True})
-            for element in elements:
-                email = element.get(attr, '').strip()
-                if email and self._is_valid_email_format(email):
-                    emails.add(email)
-                    logger.debug(f"Extracted email from {attr}: {email}")
+        logger.debug("Extracted {} emails from data attributes", len(emails))
 
         return emails
 
@@ -264,27 +438,7 @@ class EmailDeobfuscator:
         Returns:
             True if valid format
         """
-        if not email or len(email) < 5:
-            return False
-
-        # Basic email regex
-        pattern = r'^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}$'
-        if not re.match(pattern, email):
-            return False
-
-        # Exclude common false positives
-        false_positives = [
-            'email@example.com',
-            'user@example.com',
-            'admin@example.com',
-            'info@example.com',
-            'test@test.com',
-            'example@example.com'
-        ]
-        if email.lower() in false_positives:
-            return False
-
-        return True
+        return _is_valid_email(email)
 
     def deobfuscate_single(self, text: str) -> Optional[str]:
         """
@@ -300,9 +454,7 @@ class EmailDeobfuscator:
             return None
 
         # Try text pattern deobfuscation
-        decoded = text
-        for pattern, replacement in self.TEXT_PATTERNS:
-            decoded = re.sub(pattern, replacement, decoded, flags=re.IGNORECASE)
+        decoded = self.TEXT_OBFUSCATION_RE.sub(self._replace_obfuscation, text)
 
         # Check if result is valid email
         if self._is_valid_email_format(decoded):
@@ -19,11 +19,19 @@ Phase: 3 (Email Intelligence)
 
 import re
 import time
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 from collections import Counter
 
+import httpx
+import numpy as np
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from loguru import logger
 
 from config.settings import (
@@ -34,13 +42,18 @@ from config.settings import (
     RATE_LIMIT_DELAY,
     MIN_EMAIL_SCORE,
     APIS_AVAILABLE,
+    EMAIL_VALIDATION_CONCURRENCY,
+    ENABLE_ASYNC_EMAIL_VALIDATION,
+    ENABLE_CACHING,
+    CACHE_EXPIRATION_HOURS,
+    CACHE_DIR,
 )
 from config.api_clients import (
     validate_email_with_hunter,
     find_email_with_hunter,
     get_hunter_client,
 )
-from modules.utils import rate_limit, extract_domain
+from modules.utils import TokenBucket, extract_domain
 
 # ============================================================================
 # Module Configuration
@@ -52,11 +65,62 @@ ZEROBOUNCE_CREDITS_URL = "https://api.zerobounce.net/v2/getcredits"
 NEVERBOUNCE_SINGLE_URL = "https://api.neverbounce.com/v4/single/check"
 NEVERBOUNCE_BULK_URL = "https://api.neverbounce.com/v4/bulk/check"
 
-# Validation status mappings
-VALID_STATUSES = ['valid', 'deliverable']
-INVALID_STATUSES = ['invalid', 'undeliverable', 'do_not_mail', 'disposable']
-CATCHALL_STATUSES = ['catch-all', 'catchall', 'accept_all']
-UNKNOWN_STATUSES = ['unknown', 'spamtrap']
+# Validation status mappings (frozensets: hashed once, reused by `in` and Series.isin)
+VALID_STATUSES = frozenset({'valid', 'deliverable'})
+INVALID_STATUSES = frozenset({'invalid', 'undeliverable', 'do_not_mail', 'disposable'})
+CATCHALL_STATUSES = frozenset({'catch-all', 'catchall', 'accept_all'})
+UNKNOWN_STATUSES = frozenset({'unknown', 'spamtrap'})
+
+# Validation result fields -> contact columns added by enrich_contact_data
+VALIDATION_COLUMN_MAP = {
+    'status': 'email_status',
+    'score': 'email_score',
+    'is_catchall': 'email_is_catchall',
+    'is_disposable': 'email_is_disposable',
+    'service': 'email_validation_service',
+}
+
+# Low-cardinality contact columns stored as pandas categoricals after enrichment
+CATEGORICAL_COLUMNS = ['program_type', 'state', 'email_status', 'email_validation_service', 'email_source']
+
+# Persisted validation results (reused for CACHE_EXPIRATION_HOURS)
+VALIDATION_CACHE_FILE = Path(CACHE_DIR) / "email_validation_cache.csv"
+VALIDATION_CACHE_COLUMNS = [
+    'email', 'status', 'score', 'is_catchall', 'is_disposable', 'service', 'retrieved_at'
+]
+
+# Validation columns for contacts that have no email
+VALIDATION_DEFAULTS = {
+    'email_status': 'no_email',
+    'email_score': 0,
+    'email_is_catchall': False,
+    'email_is_disposable': False,
+    'email_validation_service': 'none',
+}
+
+# Provider result -> 0-100 score / status lookups
+ZEROBOUNCE_SCORES = {
+    'valid': 100,
+    'catch-all': 70,  # Medium quality - domain accepts all emails
+    'unknown': 40,
+    'invalid': 0,
+    'do_not_mail': 0,
+    'spamtrap': 0,
+}
+NEVERBOUNCE_STATUSES = {
+    0: 'valid',
+    1: 'invalid',
+    2: 'disposable',  # Treated as invalid
+    3: 'catch-all',
+    4: 'unknown',
+}
+NEVERBOUNCE_SCORES = {
+    0: 100,  # Valid
+    3: 70,   # Catch-all
+    4: 40,   # Unknown
+    1: 0,    # Invalid
+    2: 0,    # Disposable
+}
 
 # Score thresholds
 HIGH_EMAIL_SCORE = 80
@@ -65,6 +129,39 @@ MEDIUM_EMAIL_SCORE = 50
 # Initialize logger
 logger = logger.bind(module="email_validator")
 
+# Per-provider request budgets shared by every thread/coroutine
+NEVERBOUNCE_BUCKET = TokenBucket(rate=10, burst=20)
+ZEROBOUNCE_BUCKET = TokenBucket(rate=10, burst=20)
+
+
+def _create_api_session() -> requests.Session:
+    """
+    Create a pooled HTTPS session for a validation provider.
+
+    Keeps connections alive across calls (no TLS handshake per email) and
+    retries transient 429/5xx responses with a short backoff.
+    """
+    retry = Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset(['GET', 'POST']),  # Single-check POST is a lookup
+    )
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=retry)
+
+    session = requests.Session()
+    session.mount('https://', adapter)
+    return session
+
+
+# Pooled sessions, one per provider (requests.Session is thread-safe for this use)
+ZEROBOUNCE_SESSION = _create_api_session()
+NEVERBOUNCE_SESSION = _create_api_session()
+
+# Recent ZeroBounce credit checks: api_key -> (monotonic timestamp, credits)
+CREDITS_CACHE_TTL = 60.0
+_CREDITS_CACHE: Dict[str, Tuple[float, int]] = {}
+
 # Initialize Hunter.io client (None if API key not configured)
 HUNTER_CLIENT = get_hunter_client()
 
@@ -83,17 +180,7 @@ def _map_zerobounce_score(data: dict) -> int:
         Score from 0-100 (higher = better quality)
     """
     status = data.get('status', '').lower()
-
-    if status == 'valid':
-        return 100
-    elif status == 'catch-all':
-        return 70  # Medium quality - domain accepts all emails
-    elif status == 'unknown':
-        return 40
-    elif status in ['invalid', 'do_not_mail', 'spamtrap']:
-        return 0
-    else:
-        return 50  # Default for unexpected statuses
+    return ZEROBOUNCE_SCORES.get(status, 50)  # 50 for unexpected statuses
 
 
 def _map_neverbounce_status(result_code: int) -> str:
@@ -106,14 +193,7 @@ def _map_neverbounce_status(result_code: int) -> str:
     Returns:
         Standardized status: 'valid', 'invalid', 'catch-all', or 'unknown'
     """
-    mapping = {
-        0: 'valid',
-        1: 'invalid',
-        2: 'disposable',  # Treated as invalid
-        3: 'catch-all',
-        4: 'unknown'
-    }
-    return mapping.get(result_code, 'unknown')
+    return NEVERBOUNCE_STATUSES.get(result_code, 'unknown')
 
 
 def _map_neverbounce_score(data: dict) -> int:
@@ -127,24 +207,97 @@ def _map_neverbounce_score(data: dict) -> int:
         Score from 0-100 (higher = better quality)
     """
     result = data.get('result', 4)  # Default to unknown
+    return NEVERBOUNCE_SCORES.get(result, 50)
 
-    if result == 0:  # Valid
-        return 100
-    elif result == 3:  # Catch-all
-        return 70
-    elif result == 4:  # Unknown
-        return 40
-    elif result in [1, 2]:  # Invalid or disposable
-        return 0
-    else:
-        return 50
+
+def _build_zerobounce_result(email: str, data: dict) -> Optional[Dict]:
+    """
+    Convert a ZeroBounce API response into the standardized result dict.
+
+    Args:
+        email: Email address that was validated
+        data: ZeroBounce API response data
+
+    Returns:
+        Standardized validation result or None if the API reported an error
+    """
+    # Check for API errors
+    if 'error' in data:
+        logger.error(f"ZeroBounce API error for {email}: {data['error']}")
+        return None
+
+    # Map to standardized format
+    status = data.get('status', '').lower()
+    result = {
+        'email': email,
+        'status': status,
+        'sub_status': data.get('sub_status', ''),
+        'score': _map_zerobounce_score(data),
+        'is_catchall': status == 'catch-all',
+        'is_disposable': status == 'do_not_mail',
+        'is_free_email': data.get('free_email', False),
+        'mx_found': data.get('mx_found', False),
+        'smtp_provider': data.get('smtp_provider', ''),
+        'service': 'zerobounce',
+        'credits_used': 1 if status not in ['unknown', 'catch-all'] else 0
+    }
+
+    logger.info(f"ZeroBounce validated {email}: {status} (score: {result['score']})")
+    return result
+
+
+def _build_neverbounce_result(email: str, data: dict) -> Optional[Dict]:
+    """
+    Convert a NeverBounce API response into the standardized result dict.
+
+    Args:
+        email: Email address that was validated
+        data: NeverBounce API response data
+
+    Returns:
+        Standardized validation result or None if the API reported an error
+    """
+    # Check for API errors
+    if data.get('status') == 'failed':
+        logger.error(f"NeverBounce API error for {email}: {data.get('message', 'Unknown error')}")
+        return None
+
+    # Map to standardized format
+    result_code = data.get('result', 4)  # 0=valid, 1=invalid, 2=disposable, 3=catchall, 4=unknown
+    status = _map_neverbounce_status(result_code)
+
+    result = {
+        'email': email,
+        'status': status,
+        'result_code': result_code,
+        'score': _map_neverbounce_score(data),
+        'is_catchall': result_code == 3,
+        'is_disposable': result_code == 2,
+        'is_free_email': data.get('address_info', {}).get('free_email_host', False),
+        'service': 'neverbounce',
+        'credits_remaining': data.get('credits_info', {}).get('free_credits_remaining', 0)
+    }
+
+    logger.info(f"NeverBounce validated {email}: {status} (score: {result['score']})")
+    return result
+
+
+def _failed_validation(email: str) -> Dict:
+    """Placeholder result for an email no service could validate."""
+    return {
+        'email': email,
+        'status': 'unknown',
+        'score': 40,
+        'is_catchall': False,
+        'is_disposable': False,
+        'service': 'none'
+    }
 
 
 # ============================================================================
 # Email Validation Functions - Direct API Integration
 # ============================================================================
 
-@rate_limit(calls=1, period=1.0)  # 1 request per second
 def validate_email_zerobounce(email: str, api_key: Optional[str] = None) -> Optional[Dict]:
     """
     Validate single email via ZeroBounce API v2 (direct API call).
@@ -176,44 +329,21 @@ def validate_email_zerobounce(email: str, api_key: Optional[str] = None) -> Opti
 
     try:
         # Make API request
+        ZEROBOUNCE_BUCKET.acquire()
         params = {
             'api_key': key,
             'email': email,
             'ip_address': ''  # Optional
         }
 
-        response = requests.get(
+        response = ZEROBOUNCE_SESSION.get(
             ZEROBOUNCE_API_URL,
             params=params,
             timeout=REQUEST_TIMEOUT
         )
         response.raise_for_status()
 
-        data = response.json()
-
-        # Check for API errors
-        if 'error' in data:
-            logger.error(f"ZeroBounce API error for {email}: {data['error']}")
-            return None
-
-        # Map to standardized format
-        status = data.get('status', '').lower()
-        result = {
-            'email': email,
-            'status': status,
-            'sub_status': data.get('sub_status', ''),
-            'score': _map_zerobounce_score(data),
-            'is_catchall': status == 'catch-all',
-            'is_disposable': status == 'do_not_mail',
-            'is_free_email': data.get('free_email', False),
-            'mx_found': data.get('mx_found', False),
-            'smtp_provider': data.get('smtp_provider', ''),
-            'service': 'zerobounce',
-            'credits_used': 1 if status not in ['unknown', 'catch-all'] else 0
-        }
-
-        logger.info(f"ZeroBounce validated {email}: {status} (score: {result['score']})")
-        return result
+        return _build_zerobounce_result(email, response.json())
 
     except requests.exceptions.Timeout:
         logger.error(f"ZeroBounce API timeout for {email}")
@@ -226,7 +356,6 @@ def validate_email_zerobounce(email: str, api_key: Optional[str] = None) -> Opti
         return None
 
 
-@rate_limit(calls=1, period=1.0)  # 1 request per second
 def validate_email_neverbounce(email: str, api_key: Optional[str] = None) -> Optional[Dict]:
     """
     Validate single email via NeverBounce API v4 (direct API call).
@@ -258,6 +387,7 @@ def validate_email_neverbounce(email: str, api_key: Optional[str] = None) -> Opt
 
     try:
         # Make API request
+        NEVERBOUNCE_BUCKET.acquire()
         payload = {
             'key': key,
             'email': email,
@@ -265,38 +395,14 @@ def validate_email_neverbounce(email: str, api_key: Optional[str] = None) -> Opt
             'credits_info': 1   # Include credits info
         }
 
-        response = requests.post(
+        response = NEVERBOUNCE_SESSION.post(
             NEVERBOUNCE_SINGLE_URL,
             json=payload,
             timeout=REQUEST_TIMEOUT
         )
         response.raise_for_status()
 
-        data = response.json()
-
-        # Check for API errors
-        if data.get('status') == 'failed':
-            logger.error(f"NeverBounce API error for {email}: {data.get('message', 'Unknown error')}")
-            return None
-
-        # Map to standardized format
-        result_code = data.get('result', 4)  # 0=valid, 1=invalid, 2=disposable, 3=catchall, 4=unknown
-        status = _map_neverbounce_status(result_code)
-
-        result = {
-            'email': email,
-            'status': status,
-            'result_code': result_code,
-            'score': _map_neverbounce_score(data),
-            'is_catchall': result_code == 3,
-            'is_disposable': result_code == 2,
-            'is_free_email': data.get('address_info', {}).get('free_email_host', False),
-            'service': 'neverbounce',
-            'credits_remaining': data.get('credits_info', {}).get('free_credits_remaining', 0)
-        }
-
-        logger.info(f"NeverBounce validated {email}: {status} (score: {result['score']})")
-        return result
+        return _build_neverbounce_result(email, response.json())
 
     except requests.exceptions.Timeout:
         logger.error(f"NeverBounce API timeout for {email}")
@@ -309,6 +415,37 @@ def validate_email_neverbounce(email: str, api_key: Optional[str] = None) -> Opt
         return None
 
 
+class _NoValidationService(Exception):
+    """Raised inside the cached validator so misses are never memoized."""
+
+
+@lru_cache(maxsize=32768)
+def _validate_email_auto_cached(email: str) -> Dict:
+    """
+    Memoized NeverBounce -> ZeroBounce -> Hunter.io chain on a normalized email.
+
+    Raises:
+        _NoValidationService: If every service failed (lru_cache does not
+            store exceptions, so the email is retried next time)
+    """
+    # Try NeverBounce first (highest free tier)
+    result = validate_email_neverbounce(email)
+    if result:
+        return result
+
+    # Fall back to ZeroBounce
+    result = validate_email_zerobounce(email)
+    if result:
+        return result
+
+    # Fall back to Hunter.io
+    result = validate_email_with_hunter(email, HUNTER_CLIENT)
+    if result:
+        return result
+
+    raise _NoValidationService(email)
+
+
 def validate_email_auto(email: str) -> Optional[Dict]:
     """
     Validate email using the best available service.
@@ -318,24 +455,132 @@ def validate_email_auto(email: str) -> Optional[Dict]:
     2. ZeroBounce (100 free validations)
     3. Hunter.io (50 searches/month)
 
+    Results are cached per normalized (stripped, lower-cased) email for the
+    life of the process, so repeats across pages cost no API credits.
+
     Args:
         email: Email address to validate
 
     Returns:
         Validation result dict or None if all services unavailable
     """
-    # Try NeverBounce first (highest free tier)
-    result = validate_email_neverbounce(email)
+    try:
+        result = _validate_email_auto_cached(email.strip().lower())
+    except _NoValidationService:
+        logger.warning(f"No email validation service available for {email}")
+        return None
+
+    # Copy so callers can't mutate the cached entry; keep the caller's spelling
+    return {**result, 'email': email}
+
+
+# ============================================================================
+# Async Email Validation - Shared Connection Pool
+# ============================================================================
+
+async def validate_email_zerobounce_async(
+    client: httpx.AsyncClient,
+    email: str,
+    api_key: Optional[str] = None
+) -> Optional[Dict]:
+    """
+    Async version of validate_email_zerobounce using a shared httpx client.
+
+    Args:
+        client: Shared httpx.AsyncClient (keeps TCP/TLS connections alive)
+        email: Email address to validate
+        api_key: ZeroBounce API key (uses ZEROBOUNCE_API_KEY if not provided)
+
+    Returns:
+        Validation result dict (see validate_email_zerobounce) or None
+    """
+    key = api_key or ZEROBOUNCE_API_KEY
+
+    if not key or key == 'your_zerobounce_api_key_here':
+        return None
+
+    try:
+        await ZEROBOUNCE_BUCKET.acquire_async()
+        params = {'api_key': key, 'email': email, 'ip_address': ''}
+        response = await client.get(ZEROBOUNCE_API_URL, params=params)
+        response.raise_for_status()
+
+        return _build_zerobounce_result(email, response.json())
+
+    except httpx.TimeoutException:
+        logger.error(f"ZeroBounce API timeout for {email}")
+        return None
+    except httpx.HTTPError as e:
+        logger.error(f"ZeroBounce API request failed for {email}: {e}")
+        return None
+    except Exception as e:
+        logger.error(f"Unexpected error validating {email} with ZeroBounce: {e}")
+        return None
+
+
+async def validate_email_neverbounce_async(
+    client: httpx.AsyncClient,
+    email: str,
+    api_key: Optional[str] = None
+) -> Optional[Dict]:
+    """
+    Async version of validate_email_neverbounce using a shared httpx client.
+
+    Args:
+        client: Shared httpx.AsyncClient (keeps TCP/TLS connections alive)
+        email: Email address to validate
+        api_key: NeverBounce API key (uses NEVERBOUNCE_API_KEY if not provided)
+
+    Returns:
+        Validation result dict (see validate_email_neverbounce) or None
+    """
+    key = api_key or NEVERBOUNCE_API_KEY
+
+    if not key or key == 'your_neverbounce_api_key_here':
+        return None
+
+    try:
+        await NEVERBOUNCE_BUCKET.acquire_async()
+        payload = {'key': key, 'email': email, 'address_info': 1, 'credits_info': 1}
+        response = await client.post(NEVERBOUNCE_SINGLE_URL, json=payload)
+        response.raise_for_status()
+
+        return _build_neverbounce_result(email, response.json())
+
+    except httpx.TimeoutException:
+        logger.error(f"NeverBounce API timeout for {email}")
+        return None
+    except httpx.HTTPError as e:
+        logger.error(f"NeverBounce API request failed for {email}: {e}")
+        return None
+    except Exception as e:
+        logger.error(f"Unexpected error validating {email} with NeverBounce: {e}")
+        return None
+
+
+async def validate_email_auto_async(client: httpx.AsyncClient, email: str) -> Optional[Dict]:
+    """
+    Async version of validate_email_auto (NeverBounce -> ZeroBounce -> Hunter.io).
+
+    Hunter.io has no async client, so it runs in the default executor.
+
+    Args:
+        client: Shared httpx.AsyncClient
+        email: Email address to validate
+
+    Returns:
+        Validation result dict or None if all services unavailable
+    """
+    result = await validate_email_neverbounce_async(client, email)
     if result:
         return result
 
-    # Fall back to ZeroBounce
-    result = validate_email_zerobounce(email)
+    result = await validate_email_zerobounce_async(client, email)
     if result:
         return result
 
-    # Fall back to Hunter.io
-    result = validate_email_with_hunter(email, HUNTER_CLIENT)
+    loop = asyncio.get_running_loop()
+    result = await loop.run_in_executor(None, validate_email_with_hunter, email, HUNTER_CLIENT)
     if result:
         return result
 
@@ -376,21 +621,37 @@ def is_catchall_domain(domain: str, validation_result: Optional[Dict] = None) ->
 # Batch Email Validation
 # ============================================================================
 
+def _validate_with_service(email: str, service: str) -> Optional[Dict]:
+    """Validate one email with the chosen service ('auto' for unknown names)."""
+    if service == 'neverbounce':
+        return validate_email_neverbounce(email)
+    elif service == 'zerobounce':
+        return validate_email_zerobounce(email)
+    elif service == 'hunter':
+        return validate_email_with_hunter(email)
+    return validate_email_auto(email)
+
+
 def batch_validate_emails(
     emails: List[str],
     service: str = 'auto',
-    max_batch_size: int = 200
+    max_batch_size: int = 200,
+    max_workers: int = EMAIL_VALIDATION_CONCURRENCY
 ) -> pd.DataFrame:
     """
     Batch validate emails using available service.
 
+    Validation is IO-bound, so each batch is fanned out over a thread pool.
+    Request pacing comes from the shared per-provider token buckets.
+
     Args:
         emails: List of email addresses to validate
         service: 'auto', 'neverbounce', 'zerobounce', or 'hunter'
         max_batch_size: Maximum emails per batch (for rate limiting)
+        max_workers: Concurrent validation threads per batch
 
     Returns:
-        DataFrame with validation results:
+        DataFrame with validation results (in input order):
         - email: str
         - status: 'valid|invalid|catch-all|unknown'
         - score: int (0-100)
@@ -403,62 +664,190 @@ def batch_validate_emails(
 
     logger.info(f"Batch validating {len(emails)} emails using {service} service")
 
+    if service not in ('auto', 'neverbounce', 'zerobounce', 'hunter'):
+        logger.warning(f"Unknown service '{service}', using auto")
+        service = 'auto'
+
+    # Skip empty emails
+    emails = [email for email in emails if email and not pd.isna(email)]
+    validate = partial(_validate_with_service, service=service)
+
     results = []
 
-    # Process in batches to respect rate limits
-    for i in range(0, len(emails), max_batch_size):
-        batch = emails[i:i + max_batch_size]
-        logger.info(f"Processing batch {i // max_batch_size + 1}: {len(batch)} emails")
-
-        for email in batch:
-            # Skip empty emails
-            if not email or pd.isna(email):
-                continue
-
-            # Validate based on service choice
-            if service == 'auto':
-                result = validate_email_auto(email)
-            elif service == 'neverbounce':
-                result = validate_email_neverbounce(email)
-            elif service == 'zerobounce':
-                result = validate_email_zerobounce(email)
-            elif service == 'hunter':
-                result = validate_email_with_hunter(email)
-            else:
-                logger.warning(f"Unknown service '{service}', using auto")
-                result = validate_email_auto(email)
-
-            # Add to results (even if None - we'll track failures)
-            if result:
-                results.append(result)
-            else:
-                # Create placeholder for failed validation
-                results.append({
-                    'email': email,
-                    'status': 'unknown',
-                    'score': 40,
-                    'is_catchall': False,
-                    'is_disposable': False,
-                    'service': 'none'
-                })
-
-            # Small delay between requests to be respectful
-            time.sleep(0.5)
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        # Process in batches to respect rate limits
+        for i in range(0, len(emails), max_batch_size):
+            batch = emails[i:i + max_batch_size]
+            logger.info(f"Processing batch {i // max_batch_size + 1}: {len(batch)} emails")
+
+            # executor.map yields in submission order
+            for email, result in zip(batch, executor.map(validate, batch)):
+                # Add to results (even if None - we'll track failures)
+                results.append(result or _failed_validation(email))
 
     # Convert to DataFrame
     df = pd.DataFrame(results)
 
     # Log summary statistics
     if not df.empty:
-        valid_count = len(df[df['status'].isin(VALID_STATUSES)])
-        invalid_count = len(df[df['status'].isin(INVALID_STATUSES)])
-        catchall_count = len(df[df['is_catchall'] == True])
+        valid_count = int(df['status'].isin(VALID_STATUSES).sum())
+        invalid_count = int(df['status'].isin(INVALID_STATUSES).sum())
+        catchall_count = int(df['is_catchall'].astype(bool).sum())
 
         logger.success(f"Batch validation complete: {valid_count} valid, {invalid_count} invalid, {catchall_count} catch-all")
 
     return df
 
 
+async def batch_validate_emails_async(
+    emails: List[str],
+    service: str = 'auto',
+    concurrency: int = EMAIL_VALIDATION_CONCURRENCY
+) -> pd.DataFrame:
+    """
+    Batch validate emails concurrently over one pooled HTTP connection set.
+
+    All requests share a single httpx.AsyncClient (TCP/TLS reuse) and at
+    most `concurrency` validations are in flight at once, so network round
+    trips overlap instead of running back to back.
+
+    Args:
+        emails: List of email addresses to validate
+        service: 'auto', 'neverbounce', or 'zerobounce'
+        concurrency: Maximum number of in-flight validations
+
+    Returns:
+        DataFrame with the same columns as batch_validate_emails(), in input order
+    """
+    emails = [email for email in emails if email and not pd.isna(email)]
+
+    if not emails:
+        return pd.DataFrame()
+
+    logger.info(f"Async batch validating {len(emails)} emails using {service} service ({concurrency} concurrent)")
+
+    semaphore = asyncio.Semaphore(concurrency)
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT, limits=limits) as client:
+
+        async def validate_one(email: str) -> Dict:
+            async with semaphore:
+                if service == 'neverbounce':
+                    result = await validate_email_neverbounce_async(client, email)
+                elif service == 'zerobounce':
+                    result = await validate_email_zerobounce_async(client, email)
+                else:
+                    result = await validate_email_auto_async(client, email)
+            return result or _failed_validation(email)
+
+        results = await asyncio.gather(*(validate_one(email) for email in emails))
+
+    df = pd.DataFrame(results)
+
+    valid_count = int(df['status'].isin(VALID_STATUSES).sum())
+    invalid_count = int(df['status'].isin(INVALID_STATUSES).sum())
+    catchall_count = int(df['is_catchall'].astype(bool).sum())
+
+    logger.success(f"Async batch validation complete: {valid_count} valid, {invalid_count} invalid, {catchall_count} catch-all")
+
+    return df
+
+
+# ============================================================================
+# Validation Result Cache - Persisted Across Runs
+# ============================================================================
+
+def load_validation_cache() -> pd.DataFrame:
+    """
+    Load unexpired validation results from VALIDATION_CACHE_FILE.
+
+    Returns:
+        DataFrame of cached results keyed by normalized email (empty if
+        caching is disabled or nothing usable is cached)
+    """
+    if not ENABLE_CACHING or not VALIDATION_CACHE_FILE.exists():
+        return pd.DataFrame(columns=VALIDATION_CACHE_COLUMNS)
+
+    try:
+        cache_df = pd.read_csv(VALIDATION_CACHE_FILE, parse_dates=['retrieved_at'])
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable validation cache: {e}")
+        return pd.DataFrame(columns=VALIDATION_CACHE_COLUMNS)
+
+    cutoff = pd.Timestamp.now() - pd.Timedelta(hours=CACHE_EXPIRATION_HOURS)
+    return cache_df[cache_df['retrieved_at'] >= cutoff]
+
+
+def save_validation_cache(cache_df: pd.DataFrame, validation_df: pd.DataFrame) -> None:
+    """
+    Merge fresh validation results into the cache file.
+
+    Placeholder results (no service answered) are not cached so those
+    emails are retried next run.
+
+    Args:
+        cache_df: Unexpired entries returned by load_validation_cache
+        validation_df: New results from batch validation
+    """
+    if not ENABLE_CACHING or validation_df.empty:
+        return
+
+    fresh = validation_df[validation_df['service'] != 'none'].assign(
+        email=lambda df: df['email'].str.strip().str.lower(),
+        retrieved_at=pd.Timestamp.now()
+    )
+    if fresh.empty:
+        return
+
+    combined = pd.concat([cache_df, fresh[VALIDATION_CACHE_COLUMNS]], ignore_index=True)
+    combined = combined.drop_duplicates(subset=['email'], keep='last')
+
+    VALIDATION_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    combined.to_csv(VALIDATION_CACHE_FILE, index=False)
+    logger.debug(f"Cached {len(fresh)} validation results ({len(combined)} total)")
+
+
+def validate_unique_emails(emails: List[str], service: str = 'auto') -> pd.DataFrame:
+    """
+    Validate each distinct email once, reusing cached results where possible.
+
+    Args:
+        emails: Email addresses (duplicates allowed)
+        service: Service passed through to batch validation
+
+    Returns:
+        DataFrame with one validation row per distinct input email
+    """
+    unique_emails = list(dict.fromkeys(emails))
+    cache_df = load_validation_cache()
+
+    # Cache is keyed on the normalized email; hand back the caller's spelling
+    cached = cache_df.drop(columns='retrieved_at').set_index('email')
+    keys = [email.strip().lower() for email in unique_emails]
+    is_cached = [key in cached.index for key in keys]
+
+    hits = cached.loc[[key for key, hit in zip(keys, is_cached) if hit]].reset_index(drop=True)
+    hits.insert(0, 'email', [email for email, hit in zip(unique_emails, is_cached) if hit])
+    misses = [email for email, hit in zip(unique_emails, is_cached) if not hit]
+
+    if hits.shape[0]:
+        logger.info(f"Reusing {len(hits)} cached validation results")
+    if not misses:
+        return hits
+
+    if ENABLE_ASYNC_EMAIL_VALIDATION:
+        validation_df = asyncio.run(batch_validate_emails_async(misses, service=service))
+    else:
+        validation_df = batch_validate_emails(misses, service=service)
+
+    save_validation_cache(cache_df, validation_df)
+
+    if hits.empty:
+        return validation_df
+    return pd.concat([hits, validation_df], ignore_index=True)
+
+
 # ============================================================================
 # Email Finding Functions
 # ============================================================================
@@ -502,16 +891,27 @@ def find_missing_emails(contact_df: pd.DataFrame) -> pd.DataFrame:
     found_via_pattern = 0
     not_found = 0
 
-    # Process each contact missing an email
-    for idx in contact_df[missing_email_mask].index:
-        row = contact_df.loc[idx]
-
-        # Extract needed info
-        first_name = row.get('first_name', '')
-        last_name = row.get('last_name', '')
-        institution_url = row.get('institution_url', '')
-        domain = extract_domain(institution_url) if institution_url else ''
-
+    # Pull the lookup fields for missing rows once instead of per-row Series access
+    missing_df = contact_df.loc[missing_email_mask]
+    blank = pd.Series('', index=missing_df.index)
+    first_names = missing_df['first_name'].fillna('') if 'first_name' in missing_df.columns else blank
+    last_names = missing_df['last_name'].fillna('') if 'last_name' in missing_df.columns else blank
+    institution_urls = missing_df['institution_url'].fillna('') if 'institution_url' in missing_df.columns else blank
+
+    # Contacts share a handful of institution URLs - parse each distinct URL once
+    domain_by_url = {url: extract_domain(url) if url else '' for url in institution_urls.unique()}
+    domains = institution_urls.map(domain_by_url)
+
+    # Emails found per row index - written back in one vectorized assignment
+    found_emails = {}
+
+    # Process each contact missing an email (plain ndarray iteration, no Series boxing)
+    for idx, first_name, last_name, domain in zip(
+        missing_df.index.to_numpy(),
+        first_names.to_numpy(),
+        last_names.to_numpy(),
+        domains.to_numpy()
+    ):
         # Skip if we don't have minimum required info
         if not (first_name and last_name and domain):
             not_found += 1
@@ -521,9 +921,7 @@ def find_missing_emails(contact_df: pd.DataFrame) -> pd.DataFrame:
         email = find_email_with_hunter(first_name, last_name, domain, HUNTER_CLIENT)
 
         if email:
-            contact_df.at[idx, 'email'] = email
-            contact_df.at[idx, 'email_source'] = 'hunter_io'
-            contact_df.at[idx, 'confidence_score'] = contact_df.at[idx, 'confidence_score'] + 20
+            found_emails[idx] = email
             found_via_hunter += 1
             logger.info(f"Found email via Hunter.io: {email}")
             time.sleep(1.0)  # Rate limit
@@ -535,6 +933,12 @@ def find_missing_emails(contact_df: pd.DataFrame) -> pd.DataFrame:
         # We'll just mark as not found
         not_found += 1
 
+    if found_emails:
+        found_index = list(found_emails.keys())
+        contact_df.loc[found_index, 'email'] = list(found_emails.values())
+        contact_df.loc[found_index, 'email_source'] = 'hunter_io'
+        contact_df.loc[found_index, 'confidence_score'] += 20
+
     logger.success(f"Email finding complete: {found_via_hunter} via Hunter.io, {found_via_pattern} via patterns, {not_found} not found")
 
     return contact_df
@@ -544,6 +948,19 @@ def find_missing_emails(contact_df: pd.DataFrame) -> pd.DataFrame:
 # Contact Enrichment Orchestrator
 # ============================================================================
 
+def _categorize_columns(contact_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Store CATEGORICAL_COLUMNS as pandas categoricals.
+
+    These hold a handful of distinct values, so integer codes cut memory
+    and make the ==/isin filters in statistics and Excel output cheaper.
+    """
+    for column in CATEGORICAL_COLUMNS:
+        if column in contact_df.columns:
+            contact_df[column] = contact_df[column].astype('category')
+    return contact_df
+
+
 def enrich_contact_data(contact_df: pd.DataFrame) -> pd.DataFrame:
     """
     Full enrichment pipeline for Phase 3.
@@ -601,13 +1018,9 @@ def enrich_contact_data(contact_df: pd.DataFrame) -> pd.DataFrame:
         logger.warning("=" * 70)
 
         # Add placeholder columns so downstream code doesn't break
-        contact_df['email_status'] = 'not_validated'
-        contact_df['email_score'] = 0
-        contact_df['email_is_catchall'] = False
-        contact_df['email_is_disposable'] = False
-        contact_df['email_validation_service'] = 'none'
+        contact_df = contact_df.assign(**{**VALIDATION_DEFAULTS, 'email_status': 'not_validated'})
 
-        return contact_df
+        return _categorize_columns(contact_df)
 
     logger.info("=" * 70)
     logger.info("Starting Email Enrichment Pipeline (Phase 3)")
@@ -617,66 +1030,62 @@ def enrich_contact_data(contact_df: pd.DataFrame) -> pd.DataFrame:
     logger.info("Step 1: Finding missing emails...")
     contact_df = find_missing_emails(contact_df)
 
+    # Which contacts have an email - computed once, reused for defaults and stats
+    has_email = contact_df['email'].notna() & (contact_df['email'] != '')
+
     # Step 2: Validate all emails
     logger.info("Step 2: Validating emails...")
-    emails_to_validate = contact_df[contact_df['email'].notna() & (contact_df['email'] != '')]['email'].tolist()
+    emails_to_validate = contact_df.loc[has_email, 'email'].tolist()
 
     if emails_to_validate:
-        validation_df = batch_validate_emails(emails_to_validate, service='auto')
+        validation_df = validate_unique_emails(emails_to_validate, service='auto')
 
         # Merge validation results back into contact_df
         if not validation_df.empty:
-            # Create validation lookup (deduplicate emails first to avoid index errors)
-            validation_lookup = validation_df.drop_duplicates(subset=['email'], keep='first').set_index('email').to_dict('index')
-
-            # Add validation columns
-            contact_df['email_status'] = contact_df['email'].map(
-                lambda e: validation_lookup.get(e, {}).get('status', 'unknown') if e else 'no_email'
-            )
-            contact_df['email_score'] = contact_df['email'].map(
-                lambda e: validation_lookup.get(e, {}).get('score', 0) if e else 0
-            )
-            contact_df['email_is_catchall'] = contact_df['email'].map(
-                lambda e: validation_lookup.get(e, {}).get('is_catchall', False) if e else False
-            )
-            contact_df['email_is_disposable'] = contact_df['email'].map(
-                lambda e: validation_lookup.get(e, {}).get('is_disposable', False) if e else False
-            )
-            contact_df['email_validation_service'] = contact_df['email'].map(
-                lambda e: validation_lookup.get(e, {}).get('service', 'none') if e else 'none'
+            # One hashed join instead of a Python lookup per row per column
+            # (deduplicate emails first so the join can't fan out rows)
+            validation_columns = (
+                validation_df.drop_duplicates(subset=['email'], keep='first')
+                .set_index('email')[list(VALIDATION_COLUMN_MAP)]
+                .rename(columns=VALIDATION_COLUMN_MAP)
             )
+            contact_df = contact_df.drop(columns=list(VALIDATION_DEFAULTS), errors='ignore')
+            contact_df = contact_df.join(validation_columns, on='email')
+
+            # Emails the services returned nothing for
+            contact_df = contact_df.fillna({
+                'email_status': 'unknown',
+                'email_score': 0,
+                'email_is_catchall': False,
+                'email_is_disposable': False,
+                'email_validation_service': 'none',
+            })
+            contact_df['email_score'] = contact_df['email_score'].astype(int)
+            contact_df['email_is_catchall'] = contact_df['email_is_catchall'].astype(bool)
+            contact_df['email_is_disposable'] = contact_df['email_is_disposable'].astype(bool)
+
+            # Contacts without an email at all
+            contact_df.loc[~has_email, list(VALIDATION_DEFAULTS)] = list(VALIDATION_DEFAULTS.values())
     else:
         logger.warning("No emails to validate")
-        contact_df['email_status'] = 'no_email'
-        contact_df['email_score'] = 0
-        contact_df['email_is_catchall'] = False
-        contact_df['email_is_disposable'] = False
-        contact_df['email_validation_service'] = 'none'
+        contact_df = contact_df.assign(**VALIDATION_DEFAULTS)
 
     # Step 3: Update confidence scores based on email quality
     logger.info("Step 3: Updating confidence scores...")
 
-    for idx in contact_df.index:
-        email_status = contact_df.at[idx, 'email_status']
-        is_catchall = contact_df.at[idx, 'email_is_catchall']
-        email_source = contact_df.at[idx, 'email_source'] if 'email_source' in contact_df.columns else ''
-
-        # Adjust confidence score
-        score_adjustment = 0
-
-        # +30 for validated deliverable email
-        if email_status in VALID_STATUSES:
-            score_adjustment += 30
-
-        # -20 for catch-all domain
-        if is_catchall:
-            score_adjustment -= 20
+    # +30 for validated deliverable email, -20 for catch-all domain
+    score_adjustment = (
+        contact_df['email_status'].isin(VALID_STATUSES).to_numpy().astype(np.int8) * 30
+        - contact_df['email_is_catchall'].to_numpy().astype(np.int8) * 20
+    )
 
-        # Update score
-        if score_adjustment != 0:
-            current_score = contact_df.at[idx, 'confidence_score']
-            new_score = max(0, min(100, current_score + score_adjustment))
-            contact_df.at[idx, 'confidence_score'] = new_score
+    # Update (and clamp) only the scores that actually change - plain ndarray math
+    adjusted = score_adjustment != 0
+    if adjusted.any():
+        scores = contact_df['confidence_score'].to_numpy()
+        contact_df['confidence_score'] = np.where(
+            adjusted, np.clip(scores + score_adjustment, 0, 100), scores
+        )
 
     # Step 4: Log final statistics
     logger.info("=" * 70)
@@ -684,9 +1093,9 @@ def enrich_contact_data(contact_df: pd.DataFrame) -> pd.DataFrame:
     logger.info("=" * 70)
 
     total_contacts = len(contact_df)
-    with_email = len(contact_df[contact_df['email'].notna() & (contact_df['email'] != '')])
-    validated = len(contact_df[contact_df['email_status'].isin(VALID_STATUSES)])
-    catchall = len(contact_df[contact_df['email_is_catchall'] == True])
+    with_email = int(has_email.sum())
+    validated = int(contact_df['email_status'].isin(VALID_STATUSES).sum())
+    catchall = int(contact_df['email_is_catchall'].sum())  # bool dtype
 
     email_coverage = (with_email / total_contacts * 100) if total_contacts > 0 else 0
     validation_rate = (validated / with_email * 100) if with_email > 0 else 0
@@ -697,7 +1106,7 @@ def enrich_contact_data(contact_df: pd.DataFrame) -> pd.DataFrame:
     logger.info(f"Catch-all domains: {catchall}")
     logger.info("=" * 70)
 
-    return contact_df
+    return _categorize_columns(contact_df)
 
 
 # ============================================================================
@@ -708,6 +1117,9 @@ def check_zerobounce_credits(api_key: Optional[str] = None) -> Optional[int]:
     """
     Check remaining ZeroBounce API credits.
 
+    Uses the pooled ZeroBounce session; results are reused for
+    CREDITS_CACHE_TTL seconds per API key.
+
     Args:
         api_key: ZeroBounce API key (uses ZEROBOUNCE_API_KEY if not provided)
 
@@ -719,14 +1131,20 @@ def check_zerobounce_credits(api_key: Optional[str] = None) -> Optional[int]:
     if not key or key == 'your_zerobounce_api_key_here':
         return None
 
+    # Credits are checked around batch runs - reuse a recent answer
+    cached = _CREDITS_CACHE.get(key)
+    if cached and time.monotonic() - cached[0] < CREDITS_CACHE_TTL:
+        return cached[1]
+
     try:
         params = {'api_key': key}
-        response = requests.get(ZEROBOUNCE_CREDITS_URL, params=params, timeout=REQUEST_TIMEOUT)
+        response = ZEROBOUNCE_SESSION.get(ZEROBOUNCE_CREDITS_URL, params=params, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
 
         data = response.json()
         credits = int(data.get('Credits', 0))
 
+        _CREDITS_CACHE[key] = (time.monotonic(), credits)
         logger.info(f"ZeroBounce credits remaining: {credits}")
         return credits
 
@@ -743,7 +1161,12 @@ __all__ = [
     'validate_email_zerobounce',
     'validate_email_neverbounce',
     'validate_email_auto',
+    'validate_email_zerobounce_async',
+    'validate_email_neverbounce_async',
+    'validate_email_auto_async',
     'batch_validate_emails',
+    'batch_validate_emails_async',
+    'validate_unique_emails',
     'find_missing_emails',
     'enrich_contact_data',
     'is_catchall_domain',
@@ -17,29 +17,48 @@ Formatting Features:
     - Frozen header rows
     - Auto-fit column widths
     - Data filters on headers
-    - Conditional formatting for scores
+    - Conditional formatting for scores (row colors evaluated by Excel)
 
 Functions:
     - create_excel_workbook: Main Excel generator
     - add_all_contacts_sheet: Sheet 1 - All contacts
+    - split_contact_views: Sheets 2-6 - Filtered view slicing
     - add_filtered_sheet: Sheets 2-6 - Filtered views
     - add_statistics_sheet: Sheet 7 - Stats dashboard
     - add_scraping_log_sheet: Sheet 8 - Audit trail
+    - write_xlsxwriter_workbook: Constant-memory xlsxwriter alternative
     - apply_formatting: Color coding, frozen panes, auto-fit, filters
 """
 
-from typing import Dict, Any, List, Optional, Callable
+from typing import Dict, Any, Iterable, List, Optional, Set, Tuple
+import numpy as np
 import pandas as pd
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-from openpyxl.utils.dataframe import dataframe_to_rows
+from openpyxl.formatting.rule import FormulaRule
 from openpyxl.worksheet.worksheet import Worksheet
 from openpyxl.utils import get_column_letter
 import logging
 from pathlib import Path
 
+from config.settings import EXCEL_ENGINE
+
 logger = logging.getLogger(__name__)
 
+# Optional: xlsxwriter streams rows in constant-memory mode (EXCEL_ENGINE=xlsxwriter)
+try:
+    import xlsxwriter  # noqa: F401
+    XLSXWRITER_AVAILABLE = True
+except ImportError:
+    XLSXWRITER_AVAILABLE = False
+
+
+# Scraping Log columns
+SCRAPING_LOG_HEADERS = ['Institution', 'State', 'Program Type', 'Status', 'Contacts Found', 'Source URL', 'Extracted At']
+
+# Statistics percentages are stored as 0-100 numbers
+PERCENT_FORMAT = '0.0"%"'
 
 # Color scheme for confidence levels
 COLORS = {
@@ -50,6 +69,17 @@ COLORS = {
     'header_text': 'FFFFFF'  # White
 }
 
+# Shared style objects (openpyxl copies styles into the workbook's style table on assignment)
+_HEADER_FILL = PatternFill(start_color=COLORS['header'], end_color=COLORS['header'], fill_type='solid')
+_HEADER_FONT = Font(bold=True, color=COLORS['header_text'], size=11)
+_HEADER_ALIGN = Alignment(horizontal='center', vertical='center', wrap_text=True)
+_HIGH_FILL = PatternFill(start_color=COLORS['high'], end_color=COLORS['high'], fill_type='solid')
+_MED_FILL = PatternFill(start_color=COLORS['medium'], end_color=COLORS['medium'], fill_type='solid')
+_LOW_FILL = PatternFill(start_color=COLORS['low'], end_color=COLORS['low'], fill_type='solid')
+_CONFIDENCE_FILLS = {'high': _HIGH_FILL, 'medium': _MED_FILL, 'low': _LOW_FILL}
+_TITLE_FONT = Font(bold=True, size=14)
+_SECTION_FONT = Font(bold=True, size=12)
+
 
 def apply_header_formatting(ws: Worksheet) -> None:
     """
@@ -58,60 +88,96 @@ def apply_header_formatting(ws: Worksheet) -> None:
     Args:
         ws: Worksheet to format
     """
-    header_fill = PatternFill(start_color=COLORS['header'], end_color=COLORS['header'], fill_type='solid')
-    header_font = Font(bold=True, color=COLORS['header_text'], size=11)
-    header_alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
-
     for cell in ws[1]:
-        cell.fill = header_fill
-        cell.font = header_font
-        cell.alignment = header_alignment
+        cell.fill = _HEADER_FILL
+        cell.font = _HEADER_FONT
+        cell.alignment = _HEADER_ALIGN
 
 
-def apply_confidence_color_coding(ws: Worksheet, confidence_col_idx: int) -> None:
+def styled_header_row(ws: Worksheet, headers: List[Any]) -> List[WriteOnlyCell]:
+    """
+    Build a header row for a write-only sheet (formatting of apply_header_formatting).
+
+    Args:
+        ws: Write-only worksheet the row will be appended to
+        headers: Header values
+
+    Returns:
+        Styled cells to pass to ws.append()
+    """
+    cells = []
+    for value in headers:
+        cell = WriteOnlyCell(ws, value=value)
+        cell.fill = _HEADER_FILL
+        cell.font = _HEADER_FONT
+        cell.alignment = _HEADER_ALIGN
+        cells.append(cell)
+    return cells
+
+
+def apply_confidence_color_coding(
+    ws: Worksheet,
+    confidence_col_idx: int,
+    max_row: Optional[int] = None,
+    max_column: Optional[int] = None
+) -> None:
     """
     Apply color coding to rows based on confidence score.
 
+    Written as three conditional formatting rules over the data range, so
+    Excel colors the rows at open time instead of styling every cell here.
+    Rows with a non-numeric score stay uncolored; blank scores count as low.
+
     Args:
         ws: Worksheet to format
         confidence_col_idx: Column index for confidence_score (1-based)
+        max_row: Last data row (default: ws.max_row; required for write-only sheets)
+        max_column: Last data column (default: ws.max_column)
     """
-    high_fill = PatternFill(start_color=COLORS['high'], end_color=COLORS['high'], fill_type='solid')
-    medium_fill = PatternFill(start_color=COLORS['medium'], end_color=COLORS['medium'], fill_type='solid')
-    low_fill = PatternFill(start_color=COLORS['low'], end_color=COLORS['low'], fill_type='solid')
+    max_row = max_row or ws.max_row
+    max_column = max_column or ws.max_column
+    if max_row < 2:
+        return
 
-    # Skip header row (row 1)
-    for row_idx in range(2, ws.max_row + 1):
-        confidence_cell = ws.cell(row=row_idx, column=confidence_col_idx)
+    data_range = f"A2:{get_column_letter(max_column)}{max_row}"
+    for level, formula in confidence_rule_formulas(confidence_col_idx):
+        ws.conditional_formatting.add(data_range, FormulaRule(formula=[formula], fill=_CONFIDENCE_FILLS[level]))
 
-        try:
-            score = float(confidence_cell.value) if confidence_cell.value is not None else 0
 
-            # Determine fill color based on score
-            if score >= 75:
-                fill = high_fill
-            elif score >= 50:
-                fill = medium_fill
-            else:
-                fill = low_fill
+def confidence_rule_formulas(confidence_col_idx: int) -> List[Tuple[str, str]]:
+    """
+    Conditional formatting formulas for the high/medium/low confidence bands.
 
-            # Apply fill to entire row
-            for col_idx in range(1, ws.max_column + 1):
-                ws.cell(row=row_idx, column=col_idx).fill = fill
+    Args:
+        confidence_col_idx: Column index for confidence_score (1-based)
 
-        except (ValueError, TypeError):
-            # Skip if confidence score is not a valid number
-            continue
+    Returns:
+        (COLORS key, formula) pairs, relative to data row 2
+    """
+    # Skip header row (row 1); $-anchored column so every cell tests its row's score
+    score = f"${get_column_letter(confidence_col_idx)}2"
+    return [
+        ('high', f"AND(ISNUMBER({score}),{score}>=75)"),
+        ('medium', f"AND(ISNUMBER({score}),{score}>=50,{score}<75)"),
+        ('low', f"OR(ISBLANK({score}),AND(ISNUMBER({score}),{score}<50))"),
+    ]
 
 
-def auto_fit_columns(ws: Worksheet, max_width: int = 50) -> None:
+def auto_fit_columns(ws: Worksheet, max_width: int = 50, df: Optional[pd.DataFrame] = None) -> None:
     """
     Auto-fit column widths based on content.
 
     Args:
         ws: Worksheet to adjust
         max_width: Maximum column width (default: 50)
+        df: DataFrame the sheet was written from (header row + data). When
+            given, widths come from vectorized string lengths per column
+            instead of walking every cell.
     """
+    if df is not None:
+        set_column_widths(ws, dataframe_column_widths(df, max_width))
+        return
+
     for column in ws.columns:
         max_length = 0
         column_letter = get_column_letter(column[0].column)
@@ -129,6 +195,48 @@ def auto_fit_columns(ws: Worksheet, max_width: int = 50) -> None:
         ws.column_dimensions[column_letter].width = adjusted_width
 
 
+def dataframe_column_widths(df: pd.DataFrame, max_width: int = 50) -> List[int]:
+    """
+    Column widths for a sheet written from df (header row + data).
+
+    Uses vectorized string lengths per column instead of per-cell access.
+    """
+    widths = []
+    for column in df.columns:
+        values = df[column].dropna()
+        max_length = len(str(column))
+        if not values.empty:
+            max_length = max(max_length, int(values.astype(str).str.len().max()))
+        widths.append(min(max_length + 2, max_width))
+    return widths
+
+
+def row_column_widths(rows: List[List[Any]], max_width: int = 50) -> List[int]:
+    """
+    Column widths for a sheet written from a list of rows.
+
+    Matches auto_fit_columns: empty/falsy values do not count.
+    """
+    max_lengths: List[int] = []
+    for row in rows:
+        for col_idx, value in enumerate(row):
+            if col_idx == len(max_lengths):
+                max_lengths.append(0)
+            if value:
+                max_lengths[col_idx] = max(max_lengths[col_idx], len(str(value)))
+    return [min(length + 2, max_width) for length in max_lengths]
+
+
+def set_column_widths(ws: Worksheet, widths: List[int]) -> None:
+    """
+    Set column widths (1-based from column A).
+
+    On write-only sheets this must run before the first row is appended.
+    """
+    for col_idx, width in enumerate(widths, start=1):
+        ws.column_dimensions[get_column_letter(col_idx)].width = width
+
+
 def apply_data_filters(ws: Worksheet) -> None:
     """
     Add filter dropdowns to header row.
@@ -150,6 +258,37 @@ def freeze_header_row(ws: Worksheet) -> None:
     ws.freeze_panes = 'A2'
 
 
+def write_contacts_rows(ws: Worksheet, df: pd.DataFrame) -> None:
+    """
+    Stream a contacts DataFrame into a write-only sheet with full formatting.
+
+    Frozen header, column widths, styled header row, data rows, filters and
+    confidence color coding. Sheet-level settings that precede the data in
+    the XML (panes, widths) are set before the first append.
+
+    Args:
+        ws: Empty write-only worksheet
+        df: Contacts to write
+    """
+    freeze_header_row(ws)
+    set_column_widths(ws, dataframe_column_widths(df))
+
+    ws.append(styled_header_row(ws, list(df.columns)))
+    # Plain tuples: the fastest row iterator pandas offers
+    for row in df.itertuples(index=False, name=None):
+        ws.append(row)
+
+    last_row = len(df) + 1
+    last_column = len(df.columns)
+    if last_row > 1:  # Only add filters if there's data
+        ws.auto_filter.ref = f"A1:{get_column_letter(last_column)}{last_row}"
+
+    # Apply color coding if confidence_score column exists
+    if 'confidence_score' in df.columns:
+        confidence_col_idx = df.columns.get_loc('confidence_score') + 1
+        apply_confidence_color_coding(ws, confidence_col_idx, max_row=last_row, max_column=last_column)
+
+
 def add_all_contacts_sheet(wb: Workbook, contacts_df: pd.DataFrame) -> None:
     """
     Add "All Contacts" sheet with every contact and all fields.
@@ -165,38 +304,67 @@ def add_all_contacts_sheet(wb: Workbook, contacts_df: pd.DataFrame) -> None:
         logger.warning("No contacts to add to All Contacts sheet")
         return
 
-    # Write data
-    for row in dataframe_to_rows(contacts_df, index=False, header=True):
-        ws.append(row)
+    write_contacts_rows(ws, contacts_df)
 
-    # Apply formatting
-    apply_header_formatting(ws)
-    freeze_header_row(ws)
-    auto_fit_columns(ws)
-    apply_data_filters(ws)
+    logger.info(f"Added All Contacts sheet: {len(contacts_df)} contacts")
+
+
+def split_contact_views(contacts_df: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+    """
+    Slice contacts into the filtered sheet views in one pass per column.
+
+    Confidence scores are bucketed once with pd.cut (low < 50 <= medium
+    < 75 <= high) instead of re-comparing the column for each sheet.
+
+    Args:
+        contacts_df: DataFrame with all contacts
+
+    Returns:
+        Ordered dict of sheet name -> filtered DataFrame (empty DataFrame
+        when the column a view depends on is missing)
+    """
+    views = {}
+
+    if 'program_type' in contacts_df.columns:
+        program_type = contacts_df['program_type']
+        views["Law School Contacts"] = contacts_df[program_type == 'Law School']
+        views["Paralegal Program Contacts"] = contacts_df[program_type == 'Paralegal Program']
+    else:
+        views["Law School Contacts"] = pd.DataFrame()
+        views["Paralegal Program Contacts"] = pd.DataFrame()
 
-    # Apply color coding if confidence_score column exists
     if 'confidence_score' in contacts_df.columns:
-        confidence_col_idx = contacts_df.columns.get_loc('confidence_score') + 1
-        apply_confidence_color_coding(ws, confidence_col_idx)
+        level = pd.cut(
+            contacts_df['confidence_score'],
+            bins=[-np.inf, 50, 75, np.inf],
+            right=False,
+            labels=['low', 'medium', 'high']
+        )
+        views["High Confidence"] = contacts_df[level == 'high']
+        views["Medium Confidence"] = contacts_df[level == 'medium']
+        views["Needs Review"] = contacts_df[level == 'low']
+    else:
+        views["High Confidence"] = pd.DataFrame()
+        views["Medium Confidence"] = pd.DataFrame()
+        views["Needs Review"] = pd.DataFrame()
 
-    logger.info(f"Added All Contacts sheet: {len(contacts_df)} contacts")
+    return views
 
 
 def add_filtered_sheet(
     wb: Workbook,
     contacts_df: pd.DataFrame,
     sheet_name: str,
-    filter_func: Callable[[pd.DataFrame], pd.DataFrame]
+    filtered_df: pd.DataFrame
 ) -> None:
     """
-    Add a filtered sheet based on a filter function.
+    Add a sheet with a pre-filtered view of the contacts.
 
     Args:
         wb: Workbook to add sheet to
         contacts_df: DataFrame with all contacts
         sheet_name: Name for the sheet
-        filter_func: Function to filter the DataFrame
+        filtered_df: Contacts to show (from split_contact_views)
     """
     ws = wb.create_sheet(title=sheet_name)
 
@@ -205,137 +373,192 @@ def add_filtered_sheet(
         logger.warning(f"No contacts to filter for {sheet_name} sheet")
         return
 
-    # Apply filter
-    filtered_df = filter_func(contacts_df)
-
     if filtered_df.empty:
         ws.append(["No contacts match filter criteria"])
         logger.info(f"{sheet_name} sheet: 0 contacts after filtering")
         return
 
-    # Write data
-    for row in dataframe_to_rows(filtered_df, index=False, header=True):
-        ws.append(row)
-
-    # Apply formatting
-    apply_header_formatting(ws)
-    freeze_header_row(ws)
-    auto_fit_columns(ws)
-    apply_data_filters(ws)
-
-    # Apply color coding if confidence_score column exists
-    if 'confidence_score' in filtered_df.columns:
-        confidence_col_idx = filtered_df.columns.get_loc('confidence_score') + 1
-        apply_confidence_color_coding(ws, confidence_col_idx)
+    write_contacts_rows(ws, filtered_df)
 
     logger.info(f"Added {sheet_name} sheet: {len(filtered_df)} contacts")
 
 
-def add_statistics_sheet(wb: Workbook, stats: Dict[str, Any]) -> None:
+def build_statistics_rows(stats: Dict[str, Any]) -> Tuple[List[List[Any]], Set[int], Set[Tuple[int, int]]]:
     """
-    Add statistics summary sheet with metrics dashboard.
+    Lay out the statistics dashboard as plain rows (shared by both writers).
+
+    Row 0 is the title; sections are separated by one blank row.
 
     Args:
-        wb: Workbook to add sheet to
         stats: Dictionary with statistics from calculate_contact_statistics()
+
+    Returns:
+        (rows, section row indexes, (row, column) indexes of 0-100 percentages)
     """
-    ws = wb.create_sheet(title="Statistics Summary")
+    rows: List[List[Any]] = []
+    section_rows = set()
+    percent_cells = set()  # (row index, column index) holding a 0-100 percentage
 
-    # Title
-    ws['A1'] = "Contact Scraper Statistics Dashboard"
-    ws['A1'].font = Font(bold=True, size=14)
-    ws.merge_cells('A1:D1')
+    def section(title: str) -> None:
+        # One blank row between sections
+        if rows:
+            rows.append([])
+        section_rows.add(len(rows))
+        rows.append([title])
 
-    current_row = 3
+    def percent_row(*values: Any) -> None:
+        # Last value is a percentage, written as a number with a % format
+        percent_cells.add((len(rows), len(values) - 1))
+        rows.append(list(values))
 
-    # Summary statistics
-    ws[f'A{current_row}'] = "SUMMARY"
-    ws[f'A{current_row}'].font = Font(bold=True, size=12)
-    current_row += 1
+    # Title (row 1) followed by a blank row
+    rows.append(["Contact Scraper Statistics Dashboard"])
 
+    # Summary statistics
+    section("SUMMARY")
     summary = stats.get('summary', {})
-    ws.append(['Total Contacts', summary.get('total_contacts', 0)])
-    ws.append(['Total Institutions', summary.get('total_institutions', 0)])
-    ws.append(['Avg Contacts per Institution', summary.get('avg_contacts_per_institution', 0)])
-    current_row += 4
+    rows.append(['Total Contacts', summary.get('total_contacts', 0)])
+    rows.append(['Total Institutions', summary.get('total_institutions', 0)])
+    rows.append(['Avg Contacts per Institution', summary.get('avg_contacts_per_institution', 0)])
 
     # Email quality metrics
-    ws[f'A{current_row}'] = "EMAIL QUALITY"
-    ws[f'A{current_row}'].font = Font(bold=True, size=12)
-    current_row += 1
-
+    section("EMAIL QUALITY")
     email = stats.get('email_quality', {})
-    ws.append(['Contacts with Email', f"{email.get('with_email', 0)} ({email.get('email_coverage_pct', 0)}%)"])
-    ws.append(['Valid Deliverable', f"{email.get('valid_deliverable', 0)} ({email.get('valid_pct', 0)}%)"])
-    ws.append(['Catch-All Domains', f"{email.get('catch_all', 0)} ({email.get('catch_all_pct', 0)}%)"])
-    ws.append(['Invalid Emails', f"{email.get('invalid', 0)} ({email.get('invalid_pct', 0)}%)"])
-    ws.append(['Unknown Status', f"{email.get('unknown', 0)} ({email.get('unknown_pct', 0)}%)"])
-    current_row += 6
+    percent_row('Contacts with Email', email.get('with_email', 0), email.get('email_coverage_pct', 0))
+    percent_row('Valid Deliverable', email.get('valid_deliverable', 0), email.get('valid_pct', 0))
+    percent_row('Catch-All Domains', email.get('catch_all', 0), email.get('catch_all_pct', 0))
+    percent_row('Invalid Emails', email.get('invalid', 0), email.get('invalid_pct', 0))
+    percent_row('Unknown Status', email.get('unknown', 0), email.get('unknown_pct', 0))
 
     # Confidence distribution
-    ws[f'A{current_row}'] = "CONFIDENCE DISTRIBUTION"
-    ws[f'A{current_row}'].font = Font(bold=True, size=12)
-    current_row += 1
-
+    section("CONFIDENCE DISTRIBUTION")
     confidence = stats.get('confidence_distribution', {})
-    ws.append(['High (75-100)', f"{confidence.get('high', {}).get('count', 0)} ({confidence.get('high', {}).get('percentage', 0)}%)"])
-    ws.append(['Medium (50-74)', f"{confidence.get('medium', {}).get('count', 0)} ({confidence.get('medium', {}).get('percentage', 0)}%)"])
-    ws.append(['Low (0-49)', f"{confidence.get('low', {}).get('count', 0)} ({confidence.get('low', {}).get('percentage', 0)}%)"])
-    ws.append(['Average Score', confidence.get('average_score', 0)])
-    ws.append(['Median Score', confidence.get('median_score', 0)])
-    current_row += 6
+    for label, level in [('High (75-100)', 'high'), ('Medium (50-74)', 'medium'), ('Low (0-49)', 'low')]:
+        bucket = confidence.get(level, {})
+        percent_row(label, bucket.get('count', 0), bucket.get('percentage', 0))
+    rows.append(['Average Score', confidence.get('average_score', 0)])
+    rows.append(['Median Score', confidence.get('median_score', 0)])
 
     # Scraping success rate
-    ws[f'A{current_row}'] = "SCRAPING SUCCESS RATE"
-    ws[f'A{current_row}'].font = Font(bold=True, size=12)
-    current_row += 1
-
+    section("SCRAPING SUCCESS RATE")
     scraping = stats.get('scraping_success', {})
-    ws.append(['Institutions Attempted', scraping.get('total_institutions_attempted', 0)])
-    ws.append(['Successful Extractions', scraping.get('successful_extractions', 0)])
-    ws.append(['Failed Extractions', scraping.get('failed_extractions', 0)])
-    ws.append(['Success Rate', f"{scraping.get('success_rate_pct', 0)}%"])
-    ws.append(['Avg Contacts per Institution', scraping.get('avg_contacts_per_institution', 0)])
-    current_row += 6
+    rows.append(['Institutions Attempted', scraping.get('total_institutions_attempted', 0)])
+    rows.append(['Successful Extractions', scraping.get('successful_extractions', 0)])
+    rows.append(['Failed Extractions', scraping.get('failed_extractions', 0)])
+    percent_row('Success Rate', scraping.get('success_rate_pct', 0))
+    rows.append(['Avg Contacts per Institution', scraping.get('avg_contacts_per_institution', 0)])
 
     # Top roles
-    ws[f'A{current_row}'] = "TOP ROLES"
-    ws[f'A{current_row}'].font = Font(bold=True, size=12)
-    current_row += 1
-
-    ws.append(['Role', 'Count'])
-    top_roles = stats.get('top_roles', [])
-    for role_data in top_roles[:10]:
-        ws.append([role_data.get('role', ''), role_data.get('count', 0)])
-    current_row += len(top_roles) + 2
+    section("TOP ROLES")
+    rows.append(['Role', 'Count'])
+    for role_data in stats.get('top_roles', [])[:10]:
+        rows.append([role_data.get('role', ''), role_data.get('count', 0)])
 
     # State breakdown
-    ws[f'A{current_row}'] = "CONTACTS BY STATE"
-    ws[f'A{current_row}'].font = Font(bold=True, size=12)
-    current_row += 1
-
-    ws.append(['State', 'Count'])
-    state_breakdown = stats.get('by_state', {})
-    for state, count in state_breakdown.items():
-        ws.append([state, count])
-    current_row += len(state_breakdown) + 2
+    section("CONTACTS BY STATE")
+    rows.append(['State', 'Count'])
+    for state, count in stats.get('by_state', {}).items():
+        rows.append([state, count])
 
     # Program type breakdown
-    ws[f'A{current_row}'] = "CONTACTS BY PROGRAM TYPE"
-    ws[f'A{current_row}'].font = Font(bold=True, size=12)
-    current_row += 1
+    section("CONTACTS BY PROGRAM TYPE")
+    rows.append(['Program Type', 'Count', 'Percentage'])
+    for program, data in stats.get('by_program_type', {}).items():
+        percent_row(program, data.get('count', 0), data.get('percentage', 0))
 
-    ws.append(['Program Type', 'Count', 'Percentage'])
-    program_breakdown = stats.get('by_program_type', {})
-    for program, data in program_breakdown.items():
-        ws.append([program, data.get('count', 0), f"{data.get('percentage', 0)}%"])
+    return rows, section_rows, percent_cells
+
+
+def add_statistics_sheet(wb: Workbook, stats: Dict[str, Any]) -> None:
+    """
+    Add statistics summary sheet with metrics dashboard.
+
+    Rows are assembled first so column widths can be set before the
+    write-only sheet starts streaming.
+
+    Args:
+        wb: Workbook to add sheet to
+        stats: Dictionary with statistics from calculate_contact_statistics()
+    """
+    ws = wb.create_sheet(title="Statistics Summary")
+
+    rows, section_rows, percent_cells = build_statistics_rows(stats)
 
     # Auto-fit columns
-    auto_fit_columns(ws)
+    set_column_widths(ws, row_column_widths(rows))
+
+    for row_idx, row in enumerate(rows):
+        if row_idx == 0 or row_idx in section_rows:
+            cell = WriteOnlyCell(ws, value=row[0])
+            cell.font = _TITLE_FONT if row_idx == 0 else _SECTION_FONT
+            row = [cell]
+        else:
+            row = list(row)
+            for col_idx, value in enumerate(row):
+                if (row_idx, col_idx) in percent_cells:
+                    row[col_idx] = WriteOnlyCell(ws, value=value)
+                    row[col_idx].number_format = PERCENT_FORMAT
+        ws.append(row)
+
+    ws.merged_cells.add('A1:D1')
 
     logger.info("Added Statistics Summary sheet")
 
 
+def build_scraping_log_rows(
+    contacts_df: pd.DataFrame,
+    targets_df: Optional[pd.DataFrame] = None
+) -> List[Any]:
+    """
+    Scraping Log rows (without header): one per institution with contacts,
+    then one per target institution that produced none.
+
+    Args:
+        contacts_df: DataFrame with contacts (to extract scraping metrics)
+        targets_df: DataFrame with target institutions (optional)
+
+    Returns:
+        Row tuples in SCRAPING_LOG_HEADERS order
+    """
+    rows: List[Any] = []
+
+    # One row per institution: first value of each metadata column + contact count
+    if 'institution_name' in contacts_df.columns:
+        first_columns = ['state', 'program_type', 'source_url', 'extracted_at']
+        aggregations = {
+            column: (column, 'first') for column in first_columns if column in contacts_df.columns
+        }
+        aggregations['contacts_found'] = ('institution_name', 'size')
+
+        log_df = contacts_df.groupby('institution_name', observed=True).agg(**aggregations).reset_index()
+        for column in first_columns:
+            if column not in log_df.columns:
+                log_df[column] = 'N/A'
+        log_df['status'] = 'Success'
+
+        rows.extend(
+            log_df[['institution_name', 'state', 'program_type', 'status',
+                    'contacts_found', 'source_url', 'extracted_at']].itertuples(index=False, name=None)
+        )
+
+    # Add failed institutions if targets_df provided
+    if targets_df is not None and not targets_df.empty:
+        if 'institution_name' in contacts_df.columns and 'name' in targets_df.columns:
+            # Anti-join: targets with no extracted contacts (first row per name)
+            failed_df = targets_df[~targets_df['name'].isin(contacts_df['institution_name'].unique())]
+            failed_df = failed_df.drop_duplicates(subset=['name'], keep='first')
+
+            missing = {column: 'N/A' for column in ['state', 'type', 'url'] if column not in failed_df.columns}
+            failed_df = failed_df.assign(**missing, status='Failed', contacts_found=0, extracted_at='N/A')
+
+            rows.extend(
+                failed_df[['name', 'state', 'type', 'status',
+                           'contacts_found', 'url', 'extracted_at']].itertuples(index=False, name=None)
+            )
+
+    return rows
+
+
 def add_scraping_log_sheet(
     wb: Workbook,
     contacts_df: pd.DataFrame,
@@ -351,82 +574,158 @@ def add_scraping_log_sheet(
     """
     ws = wb.create_sheet(title="Scraping Log")
 
-    # Headers
-    headers = ['Institution', 'State', 'Program Type', 'Status', 'Contacts Found', 'Source URL', 'Extracted At']
-    ws.append(headers)
+    headers = SCRAPING_LOG_HEADERS
 
     if contacts_df.empty:
+        ws.append(headers)
         ws.append(['No scraping data available'])
         logger.warning("No scraping data for log sheet")
         return
 
-    # Group contacts by institution
-    if 'institution_name' in contacts_df.columns:
-        institution_groups = contacts_df.groupby('institution_name')
-
-        for institution, group in institution_groups:
-            state = group['state'].iloc[0] if 'state' in group.columns else 'N/A'
-            program_type = group['program_type'].iloc[0] if 'program_type' in group.columns else 'N/A'
-            contacts_found = len(group)
-            source_url = group['source_url'].iloc[0] if 'source_url' in group.columns else 'N/A'
-            extracted_at = group['extracted_at'].iloc[0] if 'extracted_at' in group.columns else 'N/A'
-
-            ws.append([
-                institution,
-                state,
-                program_type,
-                'Success',
-                contacts_found,
-                source_url,
-                extracted_at
-            ])
+    rows = build_scraping_log_rows(contacts_df, targets_df)
 
-    # Add failed institutions if targets_df provided
-    if targets_df is not None and not targets_df.empty:
-        if 'institution_name' in contacts_df.columns and 'name' in targets_df.columns:
-            successful_institutions = set(contacts_df['institution_name'].unique())
-            target_institutions = set(targets_df['name'].unique())
-            failed_institutions = target_institutions - successful_institutions
-
-            for institution in failed_institutions:
-                target_row = targets_df[targets_df['name'] == institution].iloc[0]
-                state = target_row.get('state', 'N/A')
-                program_type = target_row.get('type', 'N/A')
-                url = target_row.get('url', 'N/A')
-
-                ws.append([
-                    institution,
-                    state,
-                    program_type,
-                    'Failed',
-                    0,
-                    url,
-                    'N/A'
-                ])
-
-    # Apply formatting
-    apply_header_formatting(ws)
+    # Apply formatting (panes and widths precede the rows in write-only mode)
     freeze_header_row(ws)
-    auto_fit_columns(ws)
-    apply_data_filters(ws)
+    set_column_widths(ws, row_column_widths([headers] + rows))
+
+    ws.append(styled_header_row(ws, headers))
+    for row in rows:
+        ws.append(row)
+
+    if rows:  # Only add filters if there's data
+        ws.auto_filter.ref = f"A1:{get_column_letter(len(headers))}{len(rows) + 1}"
 
     logger.info(f"Added Scraping Log sheet")
 
 
-def create_excel_workbook(
+def write_xlsxwriter_workbook(
     contacts_df: pd.DataFrame,
     stats: Dict[str, Any],
     output_path: str,
     targets_df: Optional[pd.DataFrame] = None
+) -> None:
+    """
+    Write the same 8 sheets with xlsxwriter in constant-memory mode.
+
+    Constant-memory mode flushes each row to disk once the next row is
+    started, so every sheet is written strictly top to bottom: panes,
+    widths and the merged title go in before any rows.
+
+    Args:
+        contacts_df: DataFrame with all contacts
+        stats: Statistics dictionary from calculate_contact_statistics()
+        output_path: Path to save Excel file
+        targets_df: DataFrame with target institutions (optional, for scraping log)
+    """
+    with pd.ExcelWriter(
+        output_path,
+        engine='xlsxwriter',
+        engine_kwargs={'options': {'constant_memory': True}}
+    ) as writer:
+        book = writer.book
+
+        header_format = book.add_format({
+            'bold': True, 'font_color': '#FFFFFF', 'font_size': 11,
+            'bg_color': f"#{COLORS['header']}", 'align': 'center',
+            'valign': 'vcenter', 'text_wrap': True,
+        })
+        band_formats = {
+            level: book.add_format({'bg_color': f"#{COLORS[level]}"})
+            for level in ('high', 'medium', 'low')
+        }
+
+        def set_widths(ws, widths: List[int]) -> None:
+            for col_idx, width in enumerate(widths):
+                ws.set_column(col_idx, col_idx, width)
+
+        def write_rows(ws, rows: Iterable[Any], first_row: int) -> None:
+            for row_idx, row in enumerate(rows, start=first_row):
+                ws.write_row(row_idx, 0, [None if pd.isna(value) else value for value in row])
+
+        def contacts_sheet(sheet_name: str, df: pd.DataFrame, empty_message: str) -> None:
+            ws = book.add_worksheet(sheet_name)
+            if df.empty:
+                ws.write(0, 0, empty_message)
+                return
+
+            last_row, last_col = len(df), len(df.columns) - 1
+            ws.freeze_panes(1, 0)
+            set_widths(ws, dataframe_column_widths(df))
+            ws.write_row(0, 0, [str(column) for column in df.columns], header_format)
+            # Not df.to_excel: pandas emits cells column by column, which
+            # constant-memory mode would drop for every flushed row
+            write_rows(ws, df.itertuples(index=False, name=None), first_row=1)
+            ws.autofilter(0, 0, last_row, last_col)
+
+            if 'confidence_score' in df.columns:
+                confidence_col_idx = df.columns.get_loc('confidence_score') + 1
+                for level, formula in confidence_rule_formulas(confidence_col_idx):
+                    ws.conditional_format(1, 0, last_row, last_col, {
+                        'type': 'formula', 'criteria': f"={formula}", 'format': band_formats[level],
+                    })
+            logger.info(f"Added {sheet_name} sheet: {len(df)} contacts")
+
+        # Sheets 1-6: All Contacts, then program type and confidence views
+        contacts_sheet("All Contacts", contacts_df, "No contacts found")
+        for sheet_name, filtered_df in split_contact_views(contacts_df).items():
+            contacts_sheet(
+                sheet_name, filtered_df,
+                "No contacts found" if contacts_df.empty else "No contacts match filter criteria"
+            )
+
+        # Sheet 7: Statistics Summary
+        ws = book.add_worksheet("Statistics Summary")
+        rows, section_rows, percent_cells = build_statistics_rows(stats)
+        set_widths(ws, row_column_widths(rows))
+        ws.merge_range(0, 0, 0, 3, rows[0][0], book.add_format({'bold': True, 'font_size': 14}))
+        section_format = book.add_format({'bold': True, 'font_size': 12})
+        percent_format = book.add_format({'num_format': PERCENT_FORMAT})
+        for row_idx, row in enumerate(rows[1:], start=1):
+            if row_idx in section_rows:
+                ws.write(row_idx, 0, row[0], section_format)
+                continue
+            for col_idx, value in enumerate(row):
+                cell_format = percent_format if (row_idx, col_idx) in percent_cells else None
+                ws.write(row_idx, col_idx, value, cell_format)
+        logger.info("Added Statistics Summary sheet")
+
+        # Sheet 8: Scraping Log
+        ws = book.add_worksheet("Scraping Log")
+        if contacts_df.empty:
+            ws.write_row(0, 0, SCRAPING_LOG_HEADERS)
+            ws.write(1, 0, 'No scraping data available')
+            logger.warning("No scraping data for log sheet")
+            return
+
+        rows = build_scraping_log_rows(contacts_df, targets_df)
+        ws.freeze_panes(1, 0)
+        set_widths(ws, row_column_widths([SCRAPING_LOG_HEADERS, *rows]))
+        ws.write_row(0, 0, SCRAPING_LOG_HEADERS, header_format)
+        write_rows(ws, rows, first_row=1)
+        if rows:
+            ws.autofilter(0, 0, len(rows), len(SCRAPING_LOG_HEADERS) - 1)
+        logger.info(f"Added Scraping Log sheet: {len(rows)} institutions")
+
+
+def create_excel_workbook(
+    contacts_df: pd.DataFrame,
+    stats: Dict[str, Any],
+    output_path: str,
+    targets_df: Optional[pd.DataFrame] = None,
+    engine: Optional[str] = None
 ) -> bool:
     """
     Create comprehensive Excel workbook with all 8 sheets.
 
+    The workbook is write-only: rows are streamed to the sheet XML as they
+    are appended instead of being held as Cell objects for every sheet.
+
     Args:
         contacts_df: DataFrame with all contacts
         stats: Statistics dictionary from calculate_contact_statistics()
         output_path: Path to save Excel file
         targets_df: DataFrame with target institutions (optional, for scraping log)
+        engine: 'openpyxl' or 'xlsxwriter' (default: EXCEL_ENGINE setting)
 
     Returns:
         True if successful, False otherwise
@@ -434,55 +733,23 @@ def create_excel_workbook(
     try:
         logger.info(f"Creating Excel workbook: {output_path}")
 
-        # Create workbook
-        wb = Workbook()
+        engine = (engine or EXCEL_ENGINE).lower()
+        if engine == 'xlsxwriter':
+            if XLSXWRITER_AVAILABLE:
+                write_xlsxwriter_workbook(contacts_df, stats, output_path, targets_df)
+                logger.info(f"Excel workbook created successfully: {output_path}")
+                return True
+            logger.warning("xlsxwriter not installed, falling back to openpyxl")
 
-        # Remove default sheet
-        if 'Sheet' in wb.sheetnames:
-            wb.remove(wb['Sheet'])
+        # Create workbook (write-only workbooks start without a default sheet)
+        wb = Workbook(write_only=True)
 
         # Sheet 1: All Contacts
         add_all_contacts_sheet(wb, contacts_df)
 
-        # Sheet 2: Law School Contacts
-        add_filtered_sheet(
-            wb,
-            contacts_df,
-            "Law School Contacts",
-            lambda df: df[df['program_type'] == 'Law School'] if 'program_type' in df.columns else pd.DataFrame()
-        )
-
-        # Sheet 3: Paralegal Program Contacts
-        add_filtered_sheet(
-            wb,
-            contacts_df,
-            "Paralegal Program Contacts",
-            lambda df: df[df['program_type'] == 'Paralegal Program'] if 'program_type' in df.columns else pd.DataFrame()
-        )
-
-        # Sheet 4: High Confidence (>= 75)
-        add_filtered_sheet(
-            wb,
-            contacts_df,
-            "High Confidence",
-            lambda df: df[df['confidence_score'] >= 75] if 'confidence_score' in df.columns else pd.DataFrame()
-        )
-
-        # Sheet 5: Medium Confidence (50-74)
-        add_filtered_sheet(
-            wb,
-            contacts_df,
-            "Medium Confidence",
-            lambda df: df[(df['confidence_score'] >= 50) & (df['confidence_score'] < 75)] if 'confidence_score' in df.columns else pd.DataFrame()
-        )
-
-        # Sheet 6: Needs Review (< 50)
-        add_filtered_sheet(
-            wb,
-            contacts_df,
-            "Needs Review",
-            lambda df: df[df['confidence_score'] < 50] if 'confidence_score' in df.columns else pd.DataFrame()
-        )
+        # Sheets 2-6: Program type and confidence views
+        for sheet_name, filtered_df in split_contact_views(contacts_df).items():
+            add_filtered_sheet(wb, contacts_df, sheet_name, filtered_df)
 
         # Sheet 7: Statistics Summary
         add_statistics_sheet(wb, stats)
@@ -15,17 +15,47 @@ Sprint: 2.3
 
 import re
 import json
+import sqlite3
+from contextlib import closing
 from pathlib import Path
 from typing import Optional, Dict, Tuple
-from urllib.parse import urlparse
-from collections import defaultdict
-from modules.utils import setup_logger
+from dataclasses import dataclass
+from modules.utils import setup_logger, url_netloc, compile_ordered_union
 
 logger = setup_logger("fetch_router")
 
-# Cache file for domain statistics
+# Domain statistics database (one row per domain, upserted on save)
+STATS_DB = Path("output/cache/domain_fetch_stats.sqlite3")
+STATS_DB.parent.mkdir(parents=True, exist_ok=True)
+
+# Legacy JSON snapshot, imported once when the database does not exist yet
 CACHE_FILE = Path("output/cache/domain_fetch_stats.json")
-CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+
+STATS_COLUMNS = ['static_success', 'static_total', 'playwright_success', 'playwright_total', 'last_method']
+
+# Recorded fetches between automatic saves
+SAVE_EVERY = 10
+
+_CREATE_STATS_TABLE = """
+    CREATE TABLE IF NOT EXISTS domain_stats (
+        domain TEXT PRIMARY KEY,
+        static_success INTEGER NOT NULL DEFAULT 0,
+        static_total INTEGER NOT NULL DEFAULT 0,
+        playwright_success INTEGER NOT NULL DEFAULT 0,
+        playwright_total INTEGER NOT NULL DEFAULT 0,
+        last_method TEXT
+    )
+"""
+
+
+@dataclass(slots=True)
+class DomainStats:
+    """Static vs Playwright fetch outcomes for one domain."""
+    static_success: int = 0
+    static_total: int = 0
+    playwright_success: int = 0
+    playwright_total: int = 0
+    last_method: Optional[str] = None
 
 
 class FetchRouter:
@@ -35,15 +65,45 @@ class FetchRouter:
     Tracks success rates per domain and learns optimal fetch strategy.
     """
 
+    # URL patterns that strongly suggest JavaScript rendering is needed
+    PLAYWRIGHT_PATTERNS = [
+        r'/directory/search',
+        r'/people/search',
+        r'/staff/ajax',
+        r'/faculty/ajax',
+        r'\?ajax=',
+        r'#/people',
+        r'#/staff',
+        r'/api/directory',
+        r'/directory\?',  # Directory pages with query params often use JS
+        r'/faculty-staff/?\?',  # Faculty-staff pages with query params
+        r'/expert-directory',  # Expert directories often dynamic
+    ]
+
+    # Static-friendly patterns (likely work without JavaScript)
+    # REDUCED: Many directory pages actually need Playwright
+    STATIC_PATTERNS = [
+        r'/about/staff',
+        r'/about/faculty',
+        r'/contact$',
+        r'/administration$',
+    ]
+
+    # Each pattern list compiled once; the first matching pattern (list order) wins
+    _PLAYWRIGHT_RE = compile_ordered_union(PLAYWRIGHT_PATTERNS)
+    _STATIC_RE = compile_ordered_union(STATIC_PATTERNS)
+
+    # Keywords that suggest a JavaScript-rendered listing, matched in one pass
+    DIRECTORY_KEYWORDS = ['directory', 'faculty', 'staff', 'people', 'expert']
+    _DIRECTORY_KEYWORD_RE = re.compile("|".join(DIRECTORY_KEYWORDS))
+
     def __init__(self):
         """Initialize fetch router with historical data."""
-        self.domain_stats = defaultdict(lambda: {
-            'static_success': 0,
-            'static_total': 0,
-            'playwright_success': 0,
-            'playwright_total': 0,
-            'last_method': None,
-        })
+        self.domain_stats: Dict[str, DomainStats] = {}
+
+        # Fetches recorded since the last save, and the domains they touched
+        self._writes_since_save = 0
+        self._dirty_domains = set()
 
         self.load_stats()
 
@@ -65,62 +125,34 @@ class FetchRouter:
         url_lower = url.lower()
 
         # 1. URL pattern analysis (high confidence patterns)
-        # These patterns strongly suggest JavaScript rendering needed
-        playwright_patterns = [
-            r'/directory/search',
-            r'/people/search',
-            r'/staff/ajax',
-            r'/faculty/ajax',
-            r'\?ajax=',
-            r'#/people',
-            r'#/staff',
-            r'/api/directory',
-            r'/directory\?',  # Directory pages with query params often use JS
-            r'/faculty-staff/?\?',  # Faculty-staff pages with query params
-            r'/expert-directory',  # Expert directories often dynamic
-        ]
-
-        for pattern in playwright_patterns:
-            if re.search(pattern, url_lower):
-                return True, f"pattern_match:{pattern}"
+        match = self._PLAYWRIGHT_RE.match(url_lower)
+        if match:
+            return True, f"pattern_match:{self.PLAYWRIGHT_PATTERNS[int(match.lastgroup[1:])]}"
 
         # 2. Static-friendly patterns (likely work without JavaScript)
-        # REDUCED: Many directory pages actually need Playwright
-        static_patterns = [
-            r'/about/staff',
-            r'/about/faculty',
-            r'/contact$',
-            r'/administration$',
-        ]
-
-        static_match = False
-        for pattern in static_patterns:
-            if re.search(pattern, url_lower):
-                static_match = True
-                break
+        static_match = self._STATIC_RE.match(url_lower) is not None
 
         # 3. Domain-based prediction (historical success rate)
         if domain in self.domain_stats:
             stats = self.domain_stats[domain]
             static_rate = self._success_rate(
-                stats['static_success'], stats['static_total']
+                stats.static_success, stats.static_total
             )
             playwright_rate = self._success_rate(
-                stats['playwright_success'], stats['playwright_total']
+                stats.playwright_success, stats.playwright_total
             )
 
             # If static has >70% success rate, use it
-            if static_rate > 0.7 and stats['static_total'] >= 3:
+            if static_rate > 0.7 and stats.static_total >= 3:
                 return False, f"domain_history:static_rate={static_rate:.1%}"
 
             # If static has low success but Playwright works, use Playwright
-            if static_rate < 0.3 and playwright_rate > 0.7 and stats['playwright_total'] >= 2:
+            if static_rate < 0.3 and playwright_rate > 0.7 and stats.playwright_total >= 2:
                 return True, f"domain_history:playwright_rate={playwright_rate:.1%}"
 
         # 4. Default strategy based on URL patterns and keywords
         # Check if URL contains directory/faculty/staff keywords
-        directory_keywords = ['directory', 'faculty', 'staff', 'people', 'expert']
-        has_directory_keyword = any(kw in url_lower for kw in directory_keywords)
+        has_directory_keyword = self._DIRECTORY_KEYWORD_RE.search(url_lower) is not None
 
         if static_match:
             # URL pattern suggests static might work - try it
@@ -149,25 +181,25 @@ class FetchRouter:
             found_contacts: Number of contacts found (0 = failed)
         """
         domain = self._extract_domain(url)
-        stats = self.domain_stats[domain]
+        stats = self.domain_stats.get(domain)
+        if stats is None:
+            stats = self.domain_stats[domain] = DomainStats()
 
         if method == 'static':
-            stats['static_total'] += 1
+            stats.static_total += 1
             if success and found_contacts > 0:
-                stats['static_success'] += 1
+                stats.static_success += 1
         elif method == 'playwright':
-            stats['playwright_total'] += 1
+            stats.playwright_total += 1
             if success and found_contacts > 0:
-                stats['playwright_success'] += 1
+                stats.playwright_success += 1
 
-        stats['last_method'] = method
+        stats.last_method = method
+        self._dirty_domains.add(domain)
 
         # Save stats periodically (every 10 fetches)
-        total_fetches = sum(
-            s['static_total'] + s['playwright_total']
-            for s in self.domain_stats.values()
-        )
-        if total_fetches % 10 == 0:
+        self._writes_since_save += 1
+        if self._writes_since_save >= SAVE_EVERY:
             self.save_stats()
 
     def get_domain_recommendation(self, domain: str) -> str:
@@ -185,15 +217,15 @@ class FetchRouter:
 
         stats = self.domain_stats[domain]
         static_rate = self._success_rate(
-            stats['static_success'], stats['static_total']
+            stats.static_success, stats.static_total
         )
         playwright_rate = self._success_rate(
-            stats['playwright_success'], stats['playwright_total']
+            stats.playwright_success, stats.playwright_total
         )
 
         return (
-            f"Static: {stats['static_success']}/{stats['static_total']} ({static_rate:.1%}) | "
-            f"Playwright: {stats['playwright_success']}/{stats['playwright_total']} ({playwright_rate:.1%})"
+            f"Static: {stats.static_success}/{stats.static_total} ({static_rate:.1%}) | "
+            f"Playwright: {stats.playwright_success}/{stats.playwright_total} ({playwright_rate:.1%})"
         )
 
     def get_stats_summary(self) -> Dict:
@@ -203,10 +235,10 @@ class FetchRouter:
         Returns:
             Dictionary with aggregate stats
         """
-        total_static = sum(s['static_total'] for s in self.domain_stats.values())
-        total_static_success = sum(s['static_success'] for s in self.domain_stats.values())
-        total_playwright = sum(s['playwright_total'] for s in self.domain_stats.values())
-        total_playwright_success = sum(s['playwright_success'] for s in self.domain_stats.values())
+        total_static = sum(s.static_total for s in self.domain_stats.values())
+        total_static_success = sum(s.static_success for s in self.domain_stats.values())
+        total_playwright = sum(s.playwright_total for s in self.domain_stats.values())
+        total_playwright_success = sum(s.playwright_success for s in self.domain_stats.values())
 
         return {
             'domains_tracked': len(self.domain_stats),
@@ -220,12 +252,8 @@ class FetchRouter:
         }
 
     def _extract_domain(self, url: str) -> str:
-        """Extract domain from URL."""
-        try:
-            parsed = urlparse(url)
-            return parsed.netloc.lower()
-        except:
-            return url.lower()
+        """Extract domain from URL (memoized per URL)."""
+        return url_netloc(url)
 
     def _success_rate(self, success: int, total: int) -> float:
         """Calculate success rate (0-1)."""
@@ -234,18 +262,52 @@ class FetchRouter:
         return success / total
 
     def save_stats(self):
-        """Save domain statistics to disk."""
+        """Save statistics of domains changed since the last save to disk."""
+        if not self._dirty_domains:
+            return
+
+        rows = [
+            (domain, *(getattr(self.domain_stats[domain], column) for column in STATS_COLUMNS))
+            for domain in self._dirty_domains
+        ]
+        updates = ", ".join(f"{column} = excluded.{column}" for column in STATS_COLUMNS)
+
         try:
-            with open(CACHE_FILE, 'w') as f:
-                # Convert defaultdict to regular dict for JSON serialization
-                stats_dict = {k: dict(v) for k, v in self.domain_stats.items()}
-                json.dump(stats_dict, f, indent=2)
-            logger.debug(f"Saved fetch stats for {len(self.domain_stats)} domains")
+            with closing(sqlite3.connect(STATS_DB)) as conn, conn:
+                conn.execute(_CREATE_STATS_TABLE)
+                conn.executemany(
+                    f"INSERT INTO domain_stats (domain, {', '.join(STATS_COLUMNS)}) "
+                    f"VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT(domain) DO UPDATE SET {updates}",
+                    rows
+                )
+            self._writes_since_save = 0
+            self._dirty_domains.clear()
+            logger.debug(f"Saved fetch stats for {len(rows)} domains")
         except Exception as e:
             logger.error(f"Failed to save fetch stats: {e}")
 
     def load_stats(self):
         """Load domain statistics from disk."""
+        if not STATS_DB.exists():
+            self._import_legacy_stats()
+            return
+
+        try:
+            with closing(sqlite3.connect(STATS_DB)) as conn:
+                conn.execute(_CREATE_STATS_TABLE)
+                rows = conn.execute(
+                    f"SELECT domain, {', '.join(STATS_COLUMNS)} FROM domain_stats"
+                ).fetchall()
+
+            for domain, *values in rows:
+                self.domain_stats[domain] = DomainStats(**dict(zip(STATS_COLUMNS, values)))
+
+            logger.info(f"Loaded fetch stats for {len(self.domain_stats)} domains")
+        except Exception as e:
+            logger.error(f"Failed to load fetch stats: {e}")
+
+    def _import_legacy_stats(self):
+        """Load the old JSON snapshot; its domains are written to the database on the next save."""
         if not CACHE_FILE.exists():
             logger.debug("No cached fetch stats found")
             return
@@ -254,11 +316,11 @@ class FetchRouter:
             with open(CACHE_FILE, 'r') as f:
                 stats_dict = json.load(f)
 
-            # Restore defaultdict structure
             for domain, stats in stats_dict.items():
-                self.domain_stats[domain] = stats
+                self.domain_stats[domain] = DomainStats(**stats)
+            self._dirty_domains.update(stats_dict)
 
-            logger.info(f"Loaded fetch stats for {len(self.domain_stats)} domains")
+            logger.info(f"Loaded fetch stats for {len(self.domain_stats)} domains (legacy JSON)")
         except Exception as e:
             logger.error(f"Failed to load fetch stats: {e}")
 
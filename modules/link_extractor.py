@@ -9,30 +9,77 @@ Author: Claude Code
 Date: 2025-12-29
 """
 
+import heapq
 import re
-from typing import List, Dict, Tuple, Set
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, List, Dict, Optional, Tuple, Set
 from urllib.parse import urljoin, urlparse
 from bs4 import BeautifulSoup
 from loguru import logger
 
+from modules.utils import compile_ordered_union, url_netloc
 
-class ProfileLink:
-    """Represents a link to an individual profile page."""
+# Optional: pyahocorasick scans text for every keyword of a list in one pass
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
 
-    def __init__(self, url: str, text: str, score: int, context: str = ''):
-        """
-        Initialize profile link.
 
-        Args:
-            url: Full URL to profile page
-            text: Link anchor text
-            score: Priority score (0-100, higher = more likely to be a profile)
-            context: Surrounding HTML context
-        """
-        self.url = url
-        self.text = text
-        self.score = score
-        self.context = context
+def _split_literal_patterns(patterns: List[str]) -> Tuple[Tuple[str, ...], Tuple[str, ...], List[str]]:
+    """
+    Split anchor-only regexes into plain literals.
+
+    Returns:
+        (prefixes for '^lit', suffixes for 'lit$', substrings for everything else)
+    """
+    prefixes, suffixes, substrings = [], [], []
+    for pattern in patterns:
+        literal = re.sub(r'\\(.)', r'\1', pattern.strip('^$'))
+        if pattern.startswith('^'):
+            prefixes.append(literal)
+        elif pattern.endswith('$'):
+            suffixes.append(literal)
+        else:
+            substrings.append(literal)
+    return tuple(prefixes), tuple(suffixes), substrings
+
+
+def _literal_matcher(words: List[str]) -> Callable[[str], bool]:
+    """
+    Build a one-pass "text contains any of words" test.
+
+    Uses an Aho-Corasick automaton when pyahocorasick is installed, else a
+    single escaped regex alternation.
+    """
+    if AHOCORASICK_AVAILABLE:
+        automaton = ahocorasick.Automaton()
+        for word in words:
+            automaton.add_word(word, word)
+        automaton.make_automaton()
+        return lambda text: next(automaton.iter(text), None) is not None
+
+    pattern = re.compile("|".join(map(re.escape, words)))
+    return lambda text: pattern.search(text) is not None
+
+
+@dataclass(slots=True)
+class ProfileLink:
+    """
+    Represents a link to an individual profile page.
+
+    Attributes:
+        url: Full URL to profile page
+        text: Link anchor text
+        score: Priority score (0-100, higher = more likely to be a profile)
+        context: Surrounding HTML context
+    """
+    url: str
+    text: str
+    score: int
+    context: str = ''
 
     def __repr__(self):
         return f"ProfileLink(url={self.url[:50]}, text={self.text[:30]}, score={self.score})"
@@ -84,12 +131,40 @@ class LinkExtractor:
         r'javascript:',
     ]
 
+    # Pattern tables compiled once; _score_profile_link does a single match per table
+    _URL_RE = compile_ordered_union(list(URL_PATTERNS))
+    _URL_SCORES = list(URL_PATTERNS.values())
+    # HTML structure bonuses (parent class, repeating listing, headshot image)
+    PARENT_CLASS_BONUS = 25
+    LISTING_BONUS = 15
+    IMAGE_BONUS = 10
+
+    # Hrefs dropped before resolving or scoring
+    SKIP_HREF_PREFIXES = ('#', 'mailto:', 'javascript:')
+
     # Social media domains to exclude
     SOCIAL_MEDIA_DOMAINS = [
         'linkedin.com', 'twitter.com', 'facebook.com', 'instagram.com',
         'youtube.com', 'vimeo.com', 'researchgate.net', 'academia.edu'
     ]
 
+    # Anchor text / parent class keywords
+    TITLE_KEYWORDS = ['director', 'dean', 'professor', 'librarian', 'administrator']
+    ACTION_PHRASES = ['view profile', 'read bio', 'learn more', 'see bio']
+    PROFILE_INDICATORS = ['profile', 'person', 'faculty', 'staff', 'bio', 'member', 'card']
+
+    # Social media hosts: the domain itself or any subdomain of it
+    _SOCIAL_DOMAINS = frozenset(SOCIAL_MEDIA_DOMAINS)
+    _SOCIAL_SUFFIXES = tuple(f'.{domain}' for domain in SOCIAL_MEDIA_DOMAINS)
+
+    # Exclusions are literal: anchors become startswith/endswith tuples and the
+    # remaining substrings share one Aho-Corasick scan
+    _EXCLUDE_PREFIXES, _EXCLUDE_SUFFIXES, _EXCLUDE_SUBSTRINGS = _split_literal_patterns(EXCLUDE_PATTERNS)
+    _has_excluded_substring = staticmethod(_literal_matcher(_EXCLUDE_SUBSTRINGS))
+    _has_title_keyword = staticmethod(_literal_matcher(TITLE_KEYWORDS))
+    _has_action_phrase = staticmethod(_literal_matcher(ACTION_PHRASES))
+    _has_profile_indicator = staticmethod(_literal_matcher(PROFILE_INDICATORS))
+
     def __init__(self, max_links_per_page: int = 30, min_score: int = 40):
         """
         Initialize link extractor.
@@ -120,31 +195,40 @@ class LinkExtractor:
         if not html:
             return []
 
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, 'lxml')
         links = []
         seen_urls = set()
+        sibling_counts: Dict[Tuple[int, str, Tuple[str, ...]], int] = {}
 
         # Find all links
         all_links = soup.find_all('a', href=True)
         logger.debug(f"Found {len(all_links)} total links on directory page")
 
-        for link in all_links:
-            href = link.get('href', '').strip()
-            text = link.get_text().strip()
-
-            # Skip empty or anchor links
-            if not href or href.startswith('#'):
-                continue
-
-            # Resolve relative URLs
-            full_url = urljoin(directory_url, href)
-
+        # URL-only passes over all hrefs, so only candidates reach the tree walks:
+        # skip empty/anchor/non-HTTP hrefs (the scorer excludes them anyway),
+        # resolve each distinct href once, drop URLs the URL scorer excludes
+        hrefs = [link.get('href', '').strip() for link in all_links]
+        resolved_urls = {
+            href: urljoin(directory_url, href)
+            for href in dict.fromkeys(hrefs)
+            if href and not href.startswith(self.SKIP_HREF_PREFIXES)
+        }
+        excluded_urls = {url for url in set(resolved_urls.values()) if self._score_url(url) is None}
+        candidates = [
+            (link, resolved_urls[href])
+            for link, href in zip(all_links, hrefs)
+            if href in resolved_urls and resolved_urls[href] not in excluded_urls
+        ]
+
+        for link, full_url in candidates:
             # Skip duplicates
             if full_url in seen_urls:
                 continue
 
+            text = link.get_text().strip()
+
             # Check if this looks like a profile link
-            score = self._score_profile_link(full_url, text, link)
+            score = self._score_profile_link(full_url, text, link, sibling_counts)
 
             # Filter by score
             if score >= self.min_score:
@@ -160,11 +244,9 @@ class LinkExtractor:
                 links.append(profile_link)
                 seen_urls.add(full_url)
 
-        # Sort by score (highest first)
-        links.sort(key=lambda x: x.score, reverse=True)
-
-        # Limit to max_links
-        links = links[:self.max_links]
+        # Keep the max_links highest-scoring links (highest first) with a bounded heap;
+        # ties keep page order, as the previous sort-then-slice did
+        links = heapq.nlargest(self.max_links, links, key=lambda x: x.score)
 
         # Update stats
         self.stats['pages_processed'] += 1
@@ -175,7 +257,13 @@ class LinkExtractor:
 
         return links
 
-    def _score_profile_link(self, url: str, text: str, link_element) -> int:
+    def _score_profile_link(
+        self,
+        url: str,
+        text: str,
+        link_element,
+        sibling_counts: Optional[Dict[Tuple[int, str, Tuple[str, ...]], int]] = None
+    ) -> int:
         """
         Score a link based on how likely it is to be a profile page.
 
@@ -183,33 +271,23 @@ class LinkExtractor:
             url: Full URL
             text: Link anchor text
             link_element: BeautifulSoup link element
+            sibling_counts: Per-page memo of similar-sibling counts keyed by
+                (id(container), tag, classes); links in the same listing
+                share one find_all instead of repeating it per link
 
         Returns:
-            Score 0-100 (higher = more likely to be profile)
+            Score 0-100 (higher = more likely to be profile). Links that
+            cannot reach min_score return their partial score early.
         """
-        score = 0
-
-        # 1. URL pattern analysis
-        url_lower = url.lower()
-
-        # Check exclude patterns first
-        for pattern in self.EXCLUDE_PATTERNS:
-            if re.search(pattern, url_lower):
-                return 0  # Excluded
-
-        # Check social media
-        parsed = urlparse(url)
-        if any(domain in parsed.netloc.lower() for domain in self.SOCIAL_MEDIA_DOMAINS):
+        # 1. URL pattern analysis (memoized per URL)
+        score = self._score_url(url)
+        if score is None:
             return 0  # Excluded
 
-        # Check profile URL patterns
-        for pattern, pattern_score in self.URL_PATTERNS.items():
-            if re.search(pattern, url_lower):
-                score += pattern_score
-                break
-
         # 2. Anchor text analysis
         if text:
+            text_lower = text.lower()
+
             # Name-like text (2-4 words, capitalized)
             words = text.split()
             if 2 <= len(words) <= 4:
@@ -220,15 +298,20 @@ class LinkExtractor:
                     score += 20
 
             # Contains job title keywords (less reliable, but can help)
-            title_keywords = ['director', 'dean', 'professor', 'librarian', 'administrator']
-            if any(keyword in text.lower() for keyword in title_keywords):
+            if self._has_title_keyword(text_lower):
                 score += 10
 
             # "View profile", "Read bio", etc.
-            action_phrases = ['view profile', 'read bio', 'learn more', 'see bio']
-            if any(phrase in text.lower() for phrase in action_phrases):
+            if self._has_action_phrase(text_lower):
                 score += 15
 
+        # The structure checks below only add points, so skip them once the
+        # score is capped or can no longer reach min_score
+        if score >= 100:
+            return 100
+        if score + self.PARENT_CLASS_BONUS + self.LISTING_BONUS + self.IMAGE_BONUS < self.min_score:
+            return score
+
         # 3. HTML structure/context analysis
         parent = link_element.parent
         if parent:
@@ -236,25 +319,70 @@ class LinkExtractor:
             parent_class_str = ' '.join(parent_classes).lower()
 
             # Check parent element classes
-            profile_indicators = ['profile', 'person', 'faculty', 'staff', 'bio', 'member', 'card']
-            if any(indicator in parent_class_str for indicator in profile_indicators):
-                score += 25
+            if self._has_profile_indicator(parent_class_str):
+                score += self.PARENT_CLASS_BONUS
 
             # Check if link is inside a repeating structure (directory listing)
             # Look for multiple siblings with same class
             siblings = parent.find_parent(['div', 'ul', 'section'])
-            if siblings:
-                similar_siblings = siblings.find_all(parent.name, class_=parent.get('class'))
-                if len(similar_siblings) >= 3:  # Part of a list
-                    score += 15
+            if siblings and score < 100 and score + self.LISTING_BONUS + self.IMAGE_BONUS >= self.min_score:
+                key = (id(siblings), parent.name, tuple(parent_classes))
+                similar_count = sibling_counts.get(key) if sibling_counts is not None else None
+                if similar_count is None:
+                    similar_count = len(siblings.find_all(parent.name, class_=parent.get('class')))
+                    if sibling_counts is not None:
+                        sibling_counts[key] = similar_count
+                if similar_count >= 3:  # Part of a list
+                    score += self.LISTING_BONUS
 
         # 4. Image proximity (profiles often have headshot + link)
-        prev_sibling = link_element.find_previous_sibling(['img', 'picture'])
-        if prev_sibling:
-            score += 10
+        if score < 100 and link_element.find_previous_sibling(['img', 'picture']):
+            score += self.IMAGE_BONUS
 
         return min(score, 100)  # Cap at 100
 
+    @classmethod
+    @lru_cache(maxsize=65536)
+    def _score_url(cls, url: str) -> Optional[int]:
+        """
+        URL-only part of the profile score.
+
+        A pure function of the URL, so repeated links (card + name + "view
+        profile") and revisited directories reuse the result.
+
+        Args:
+            url: Full URL
+
+        Returns:
+            URL_PATTERNS score (0 if none match), or None if the URL is excluded
+        """
+        url_lower = url.lower()
+
+        # Check exclude patterns first
+        if cls._is_excluded_url(url_lower):
+            return None
+
+        # Check social media
+        if cls._is_social_media(url_netloc(url)):
+            return None
+
+        # Check profile URL patterns (first matching pattern wins)
+        match = cls._URL_RE.match(url_lower)
+        return cls._URL_SCORES[int(match.lastgroup[1:])] if match else 0
+
+    @classmethod
+    def _is_social_media(cls, netloc: str) -> bool:
+        """Check whether a lower-cased netloc is a SOCIAL_MEDIA_DOMAINS host or subdomain."""
+        host = netloc.rpartition('@')[2].partition(':')[0]
+        return host in cls._SOCIAL_DOMAINS or host.endswith(cls._SOCIAL_SUFFIXES)
+
+    @classmethod
+    def _is_excluded_url(cls, url_lower: str) -> bool:
+        """Check a lower-cased URL against EXCLUDE_PATTERNS."""
+        if url_lower.startswith(cls._EXCLUDE_PREFIXES) or url_lower.endswith(cls._EXCLUDE_SUFFIXES):
+            return True
+        return cls._has_excluded_substring(url_lower)
+
     def _get_link_context(self, link_element) -> str:
         """Extract surrounding context for a link (for debugging)."""
         parent = link_element.parent
@@ -280,8 +408,7 @@ class LinkExtractor:
 
         filtered = []
         for link in links:
-            parsed = urlparse(link.url)
-            link_netloc = parsed.netloc.lower()
+            link_netloc = url_netloc(link.url)
 
             # Allow exact match or subdomain
             if link_netloc == base_netloc or link_netloc.endswith(f'.{base_netloc}'):
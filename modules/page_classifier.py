@@ -9,12 +9,35 @@ Author: Claude Code
 Date: 2025-12-29
 """
 
+import hashlib
 import re
-from typing import Dict, Tuple, Optional
+from collections import OrderedDict
+from typing import Dict, List, Tuple, Optional
 from urllib.parse import urlparse, parse_qs
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
 from loguru import logger
 
+from modules.utils import compile_ordered_union
+
+# Optional: pyahocorasick finds every HTML indicator in one pass over the page
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+def _build_indicator_automaton(groups: Dict[str, List[str]]):
+    """Aho-Corasick automaton mapping each indicator to (group, indicator); None without pyahocorasick."""
+    if not AHOCORASICK_AVAILABLE:
+        return None
+    automaton = ahocorasick.Automaton()
+    for group, indicators in groups.items():
+        for indicator in indicators:
+            automaton.add_word(indicator, (group, indicator))
+    automaton.make_automaton()
+    return automaton
+
 
 class PageType:
     """Page type constants"""
@@ -93,6 +116,13 @@ class PageClassifier:
         r'bluesky\.': (PageType.SOCIAL_MEDIA, -100),
     }
 
+    # URL pattern scores at or beyond +/- this value skip the HTML and heading analysis
+    DECISIVE_URL_SCORE = 85
+
+    # URL_PATTERNS compiled once; the first matching pattern (dict order) wins
+    _URL_RE = compile_ordered_union(list(URL_PATTERNS))
+    _URL_RESULTS = list(URL_PATTERNS.values())
+
     # HTML structure patterns
     DIRECTORY_INDICATORS = [
         'profile-card', 'person-card', 'staff-card', 'faculty-card',
@@ -110,12 +140,39 @@ class PageClassifier:
         'class-of-', 'graduation-year', 'jd-candidate', 'llm-student'
     ]
 
+    # All indicator lists share one scan of the lower-cased HTML
+    _INDICATOR_GROUPS = {
+        'directory': DIRECTORY_INDICATORS,
+        'profile': PROFILE_INDICATORS,
+        'student': STUDENT_INDICATORS,
+    }
+    _INDICATOR_AC = _build_indicator_automaton(_INDICATOR_GROUPS)
+
+    # Class patterns for person cards (div/article/section) and bio blocks (div/section);
+    # both are split out of one find_all() over their union
+    _PERSON_CLASS_RE = re.compile(r'(person|profile|staff|faculty|member)', re.I)
+    _BIO_CLASS_RE = re.compile(r'(bio|about|profile|cv)', re.I)
+    _CARD_CLASS_RE = re.compile(r'(person|profile|staff|faculty|member|bio|about|cv)', re.I)
+
+    # Profile-like path segments counted by _calculate_link_density (matched on the lower-cased href)
+    _PERSON_HREF_RE = re.compile(r'/(?:profile|bio|faculty|staff|people)/')
+
+    # Heading keywords, matched as substrings of the lower-cased heading text
+    DIRECTORY_HEADING_KEYWORDS = ['directory', 'our team', 'our people', 'staff', 'faculty']
+    STUDENT_HEADING_KEYWORDS = ['directory', 'profiles', 'roster']
+    _DIRECTORY_HEADING_RE = re.compile('|'.join(map(re.escape, DIRECTORY_HEADING_KEYWORDS)))
+    _STUDENT_HEADING_RE = re.compile('|'.join(map(re.escape, STUDENT_HEADING_KEYWORDS)))
+
+    # Recent classifications kept so chained helpers on one page skip the re-parse
+    CLASSIFY_CACHE_SIZE = 256
+
     def __init__(self):
         """Initialize page classifier."""
         self.stats = {
             'total_classified': 0,
             'by_type': {}
         }
+        self._cache: OrderedDict = OrderedDict()
 
     def classify_page(self, url: str, html: str, heading_text: Optional[str] = None) -> Tuple[str, int]:
         """
@@ -130,29 +187,65 @@ class PageClassifier:
             Tuple of (page_type, confidence_score)
             confidence_score: 0-100 (negative scores = should exclude)
         """
+        key = (
+            url,
+            heading_text,
+            len(html) if html else 0,
+            hashlib.blake2b(html.encode(), digest_size=8).digest() if html else None,
+        )
+        result = self._cache.get(key)
+        if result is not None:
+            self._cache.move_to_end(key)
+        else:
+            result = self._classify(url, html, heading_text)
+            self._cache[key] = result
+            if len(self._cache) > self.CLASSIFY_CACHE_SIZE:
+                self._cache.popitem(last=False)
+
+        page_type, confidence = result
+
+        # Update statistics
+        self.stats['total_classified'] += 1
+        self.stats['by_type'][page_type] = self.stats['by_type'].get(page_type, 0) + 1
+
+        logger.debug("Classified page: {} → {} (confidence: {})", url[:60], page_type, confidence)
+
+        return result
+
+    def _classify(self, url: str, html: str, heading_text: Optional[str]) -> Tuple[str, int]:
+        """Uncached classification behind classify_page()."""
         scores = {}
 
         # 1. URL pattern analysis
         url_type, url_score = self._classify_url(url)
         if url_type:
+            # A decisive URL pattern settles the type without parsing the HTML
+            if abs(url_score) >= self.DECISIVE_URL_SCORE:
+                return (url_type, url_score)
             scores[url_type] = url_score
 
         # 2. HTML structure analysis
         if html:
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = BeautifulSoup(html, 'lxml')
+            indicator_counts = self._count_indicators(html.lower())
+
+            # Shared DOM lookups for the scorers below
+            headings = soup.find_all(['h1', 'h2', 'h3'])
+            h1 = next((h for h in headings if h.name == 'h1'), None)
+            person_divs, bio_sections = self._find_class_blocks(soup)
 
             # Check for directory indicators
-            dir_score = self._score_directory_indicators(soup)
+            dir_score = self._score_directory_indicators(person_divs, headings, indicator_counts['directory'])
             if dir_score > 0:
                 scores[PageType.DIRECTORY_LISTING] = scores.get(PageType.DIRECTORY_LISTING, 0) + dir_score
 
             # Check for profile indicators
-            profile_score = self._score_profile_indicators(soup)
+            profile_score = self._score_profile_indicators(bio_sections, h1, indicator_counts['profile'])
             if profile_score > 0:
                 scores[PageType.INDIVIDUAL_PROFILE] = scores.get(PageType.INDIVIDUAL_PROFILE, 0) + profile_score
 
             # Check for student indicators (negative score)
-            student_score = self._score_student_indicators(soup)
+            student_score = self._score_student_indicators(headings, indicator_counts['student'])
             if student_score > 0:
                 scores[PageType.STUDENT_DIRECTORY] = -100  # Strong exclusion
 
@@ -178,70 +271,77 @@ class PageClassifier:
             page_type = max(scores, key=scores.get)
             confidence = scores[page_type]
 
-        # Update statistics
-        self.stats['total_classified'] += 1
-        self.stats['by_type'][page_type] = self.stats['by_type'].get(page_type, 0) + 1
-
-        logger.debug(f"Classified page: {url[:60]} → {page_type} (confidence: {confidence})")
-
         return (page_type, confidence)
 
     def _classify_url(self, url: str) -> Tuple[Optional[str], int]:
         """Classify based on URL patterns."""
-        parsed = urlparse(url)
         full_url = url.lower()
-        path = parsed.path.lower()
 
-        # Check each pattern
-        for pattern, (page_type, score) in self.URL_PATTERNS.items():
-            if re.search(pattern, full_url):
-                return (page_type, score)
+        # Check each pattern (one match call over the ordered union)
+        match = self._URL_RE.match(full_url)
+        if match:
+            return self._URL_RESULTS[int(match.lastgroup[1:])]
 
-        # Default: check if it's a homepage
-        if path in ['/', '', '/index.html', '/index.php']:
+        # Default: check if it's a homepage (only parsed when no pattern matched)
+        path = urlparse(url).path.lower()
+        if path in ('/', '', '/index.html', '/index.php'):
             return (PageType.HOMEPAGE, 70)
 
         return (None, 0)
 
-    def _score_directory_indicators(self, soup: BeautifulSoup) -> int:
+    def _count_indicators(self, html_lower: str) -> Dict[str, int]:
+        """Count the distinct indicators of each _INDICATOR_GROUPS list found in the HTML."""
+        if self._INDICATOR_AC is not None:
+            found = {match for _, match in self._INDICATOR_AC.iter(html_lower)}
+        else:
+            found = {
+                (group, indicator)
+                for group, indicators in self._INDICATOR_GROUPS.items()
+                for indicator in indicators
+                if indicator in html_lower
+            }
+
+        counts = dict.fromkeys(self._INDICATOR_GROUPS, 0)
+        for group, _ in found:
+            counts[group] += 1
+        return counts
+
+    def _find_class_blocks(self, soup: BeautifulSoup) -> Tuple[List[Tag], List[Tag]]:
+        """Find person-card and bio-section elements with a single DOM traversal."""
+        person_divs = []
+        bio_sections = []
+        for element in soup.find_all(['div', 'article', 'section'], class_=self._CARD_CLASS_RE):
+            classes = ' '.join(element.get('class', []))
+            if self._PERSON_CLASS_RE.search(classes):
+                person_divs.append(element)
+            if element.name != 'article' and self._BIO_CLASS_RE.search(classes):
+                bio_sections.append(element)
+        return person_divs, bio_sections
+
+    def _score_directory_indicators(self, person_divs: List[Tag], headings: List[Tag], indicator_count: int) -> int:
         """Score directory listing indicators in HTML."""
-        score = 0
-        html_text = str(soup).lower()
-
         # Check for directory-specific classes
-        for indicator in self.DIRECTORY_INDICATORS:
-            if indicator in html_text:
-                score += 15
+        score = 15 * indicator_count
 
         # Check for repeating person structures (strong signal)
-        person_divs = soup.find_all(['div', 'article', 'section'],
-                                     class_=re.compile(r'(person|profile|staff|faculty|member)', re.I))
         if len(person_divs) >= 3:  # 3+ person cards = likely a directory
             score += 30
 
         # Check for common directory headings
-        headings = soup.find_all(['h1', 'h2', 'h3'])
         for h in headings:
             h_text = h.get_text().lower()
-            if any(word in h_text for word in ['directory', 'our team', 'our people', 'staff', 'faculty']):
+            if self._DIRECTORY_HEADING_RE.search(h_text):
                 score += 20
                 break
 
         return min(score, 70)  # Cap at 70
 
-    def _score_profile_indicators(self, soup: BeautifulSoup) -> int:
+    def _score_profile_indicators(self, bio_sections: List[Tag], h1: Optional[Tag], indicator_count: int) -> int:
         """Score individual profile indicators in HTML."""
-        score = 0
-        html_text = str(soup).lower()
-
         # Check for profile-specific classes
-        for indicator in self.PROFILE_INDICATORS:
-            if indicator in html_text:
-                score += 15
+        score = 15 * indicator_count
 
         # Check for biographical content (long text blocks)
-        bio_sections = soup.find_all(['div', 'section'],
-                                     class_=re.compile(r'(bio|about|profile|cv)', re.I))
         for section in bio_sections:
             text = section.get_text()
             if len(text) > 200:  # Long bio text = likely individual profile
@@ -249,7 +349,6 @@ class PageClassifier:
                 break
 
         # Check for single person's name in h1
-        h1 = soup.find('h1')
         if h1:
             h1_text = h1.get_text()
             # Simple heuristic: if h1 has 2-4 words, might be a person's name
@@ -259,21 +358,15 @@ class PageClassifier:
 
         return min(score, 70)  # Cap at 70
 
-    def _score_student_indicators(self, soup: BeautifulSoup) -> int:
+    def _score_student_indicators(self, headings: List[Tag], indicator_count: int) -> int:
         """Score student directory indicators (for exclusion)."""
-        score = 0
-        html_text = str(soup).lower()
-
         # Check for student-specific indicators
-        for indicator in self.STUDENT_INDICATORS:
-            if indicator in html_text:
-                score += 30
+        score = 30 * indicator_count
 
         # Check headings for "student"
-        headings = soup.find_all(['h1', 'h2', 'h3'])
         for h in headings:
             h_text = h.get_text().lower()
-            if 'student' in h_text and any(word in h_text for word in ['directory', 'profiles', 'roster']):
+            if 'student' in h_text and self._STUDENT_HEADING_RE.search(h_text):
                 score += 50
                 break
 
@@ -287,13 +380,16 @@ class PageClassifier:
 
         for link in links:
             href = link.get('href', '').lower()
-            text = link.get_text().lower()
 
             # Check if link looks like a person profile
-            if any(pattern in href for pattern in ['/profile/', '/bio/', '/faculty/', '/staff/', '/people/']):
+            if self._PERSON_HREF_RE.search(href):
                 person_links += 1
-            # Or if link text looks like a name (2-4 words, capitalized)
-            elif text and 2 <= len(text.split()) <= 4:
+                continue
+
+            # Or if link text looks like a name (2-4 words, capitalized);
+            # the text is only extracted when the href did not decide
+            text = link.get_text()
+            if text and 2 <= len(text.split()) <= 4:
                 person_links += 1
 
         return person_links
@@ -303,7 +399,7 @@ class PageClassifier:
         heading_lower = heading_text.lower()
 
         # Directory indicators
-        if any(word in heading_lower for word in ['directory', 'our team', 'our people', 'staff', 'faculty']):
+        if self._DIRECTORY_HEADING_RE.search(heading_lower):
             return (PageType.DIRECTORY_LISTING, 25)
 
         # Individual profile (looks like a name)
@@ -320,8 +416,6 @@ class PageClassifier:
         Returns:
             True if page should be excluded (student directory, portal, social media)
         """
-        page_type, confidence = self.classify_page(url, html)
-
         # Exclude these types
         exclude_types = [
             PageType.STUDENT_DIRECTORY,
@@ -329,6 +423,13 @@ class PageClassifier:
             PageType.SOCIAL_MEDIA,
         ]
 
+        # An excluded type in the URL is decisive; skip parsing the HTML
+        url_type, _ = self._classify_url(url)
+        if url_type in exclude_types:
+            return True
+
+        page_type, confidence = self.classify_page(url, html)
+
         return page_type in exclude_types or confidence < 0
 
     def is_directory_listing(self, url: str, html: str = '') -> bool:
@@ -13,12 +13,29 @@ Functions:
 """
 
 from typing import Dict, Any, List, Optional
+import numpy as np
 import pandas as pd
 from collections import Counter
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Lower bounds of the medium and high confidence buckets
+CONFIDENCE_BUCKET_EDGES = np.array([50, 75])
+
+# Lower bounds of the institution contact-count buckets and their labels
+CONTACT_BUCKET_EDGES = np.array([1, 3, 6, 11])
+CONTACT_BUCKET_LABELS = ('1-2 contacts', '3-5 contacts', '6-10 contacts', '11+ contacts')
+
+# (count, percentage) result keys reported by get_email_quality_summary, in output order
+EMAIL_STATUS_KEYS = (
+    ('validated', 'validated_pct'),
+    ('valid_deliverable', 'valid_pct'),
+    ('catch_all', 'catch_all_pct'),
+    ('invalid', 'invalid_pct'),
+    ('unknown', 'unknown_pct'),
+)
+
 
 def get_state_breakdown(contacts_df: pd.DataFrame) -> Dict[str, int]:
     """
@@ -38,10 +55,10 @@ def get_state_breakdown(contacts_df: pd.DataFrame) -> Dict[str, int]:
         logger.warning("No 'state' column found in contacts DataFrame")
         return {}
 
-    state_counts = contacts_df['state'].value_counts().to_dict()
-
-    # Sort by count descending
-    state_counts = dict(sorted(state_counts.items(), key=lambda x: x[1], reverse=True))
+    # value_counts() is already sorted by count descending;
+    # categorical columns report unused categories with a count of 0
+    state_counts = contacts_df['state'].value_counts()
+    state_counts = state_counts[state_counts > 0].to_dict()
 
     logger.info(f"State breakdown calculated: {len(state_counts)} states")
     return state_counts
@@ -69,14 +86,15 @@ def get_program_type_breakdown(contacts_df: pd.DataFrame) -> Dict[str, Dict[str,
         return {}
 
     total = len(contacts_df)
-    program_counts = contacts_df['program_type'].value_counts().to_dict()
+    program_counts = contacts_df['program_type'].value_counts()
+    program_counts = program_counts[program_counts > 0]
 
-    result = {}
-    for program_type, count in program_counts.items():
-        result[program_type] = {
-            'count': count,
-            'percentage': round((count / total) * 100, 1)
-        }
+    counts = program_counts.to_numpy()
+    percentages = np.round((counts / total) * 100, 1)
+    result = {
+        program_type: {'count': count, 'percentage': percentage}
+        for program_type, count, percentage in zip(program_counts.index, counts.tolist(), percentages.tolist())
+    }
 
     logger.info(f"Program type breakdown: {len(result)} types")
     return result
@@ -118,7 +136,7 @@ def get_email_quality_summary(contacts_df: pd.DataFrame) -> Dict[str, Any]:
     total = len(contacts_df)
 
     # Email coverage
-    with_email = contacts_df['email'].notna().sum() if 'email' in contacts_df.columns else 0
+    with_email = contacts_df['email'].count() if 'email' in contacts_df.columns else 0
     email_coverage_pct = round((with_email / total) * 100, 1) if total > 0 else 0.0
 
     result = {
@@ -138,28 +156,22 @@ def get_email_quality_summary(contacts_df: pd.DataFrame) -> Dict[str, Any]:
         invalid = status_counts.get('invalid', 0)
         unknown = status_counts.get('unknown', 0)
 
-        result.update({
-            'validated': int(validated),
-            'validated_pct': round((validated / with_email) * 100, 1) if with_email > 0 else 0.0,
-            'valid_deliverable': int(valid_deliverable),
-            'valid_pct': round((valid_deliverable / with_email) * 100, 1) if with_email > 0 else 0.0,
-            'catch_all': int(catch_all),
-            'catch_all_pct': round((catch_all / with_email) * 100, 1) if with_email > 0 else 0.0,
-            'invalid': int(invalid),
-            'invalid_pct': round((invalid / with_email) * 100, 1) if with_email > 0 else 0.0,
-            'unknown': int(unknown),
-            'unknown_pct': round((unknown / with_email) * 100, 1) if with_email > 0 else 0.0
-        })
+        counts = np.array([validated, valid_deliverable, catch_all, invalid, unknown])
+        percentages = np.round((counts / with_email) * 100, 1) if with_email > 0 else np.zeros(len(counts))
+
+        for (count_key, pct_key), count, percentage in zip(EMAIL_STATUS_KEYS, counts.tolist(), percentages.tolist()):
+            result[count_key] = count
+            result[pct_key] = percentage
 
     # Validation service usage
     if 'email_validation_service' in contacts_df.columns:
-        service_counts = contacts_df[contacts_df['email_validation_service'] != 'none']['email_validation_service'].value_counts().to_dict()
-        result['validation_services'] = service_counts
+        service_counts = contacts_df['email_validation_service'].value_counts().drop('none', errors='ignore')
+        result['validation_services'] = service_counts[service_counts > 0].to_dict()
 
     # Email source breakdown
     if 'email_source' in contacts_df.columns:
-        source_counts = contacts_df['email_source'].value_counts().to_dict()
-        result['email_sources'] = source_counts
+        source_counts = contacts_df['email_source'].value_counts()
+        result['email_sources'] = source_counts[source_counts > 0].to_dict()
 
     logger.info(f"Email quality summary: {email_coverage_pct}% coverage, {result.get('valid_pct', 0)}% valid")
     return result
@@ -192,12 +204,11 @@ def get_confidence_distribution(contacts_df: pd.DataFrame) -> Dict[str, Any]:
         }
 
     total = len(contacts_df)
-    scores = contacts_df['confidence_score']
+    scores = contacts_df['confidence_score'].to_numpy(dtype=float)
+    scores = scores[~np.isnan(scores)]
 
-    # Categorize by confidence level
-    high = (scores >= 75).sum()
-    medium = ((scores >= 50) & (scores < 75)).sum()
-    low = (scores < 50).sum()
+    # Categorize by confidence level in one pass: bucket 0 = low, 1 = medium, 2 = high
+    low, medium, high = np.bincount(np.searchsorted(CONFIDENCE_BUCKET_EDGES, scores, side='right'), minlength=3)
 
     result = {
         'high': {
@@ -216,7 +227,7 @@ def get_confidence_distribution(contacts_df: pd.DataFrame) -> Dict[str, Any]:
             'range': '0-49'
         },
         'average_score': round(scores.mean(), 1),
-        'median_score': int(scores.median()),
+        'median_score': int(np.median(scores)),
         'min_score': int(scores.min()),
         'max_score': int(scores.max())
     }
@@ -251,26 +262,28 @@ def get_top_roles(contacts_df: pd.DataFrame, top_n: int = 10) -> List[Dict[str,
         logger.warning(f"No role column found in contacts DataFrame")
         return []
 
-    # Filter out NaN values
-    roles = contacts_df[contacts_df[role_column].notna()][role_column]
+    # value_counts() skips NaN values, so no separate filtering pass is needed
+    all_role_counts = contacts_df[role_column].value_counts()
+    unique_roles = int((all_role_counts > 0).sum())
 
-    if roles.empty:
+    if unique_roles == 0:
         return []
 
-    role_counts = roles.value_counts().head(top_n)
+    role_counts = all_role_counts.head(top_n)
 
     result = [
         {'role': role, 'count': int(count)}
         for role, count in role_counts.items()
     ]
 
-    logger.info(f"Top {len(result)} roles identified (out of {len(roles.unique())} unique roles)")
+    logger.info(f"Top {len(result)} roles identified (out of {unique_roles} unique roles)")
     return result
 
 
 def calculate_scraping_success_rate(
     contacts_df: pd.DataFrame,
-    targets_df: Optional[pd.DataFrame] = None
+    targets_df: Optional[pd.DataFrame] = None,
+    institution_counts: Optional[pd.Series] = None
 ) -> Dict[str, Any]:
     """
     Calculate scraping success/failure rates per institution.
@@ -278,6 +291,7 @@ def calculate_scraping_success_rate(
     Args:
         contacts_df: DataFrame with scraped contacts
         targets_df: DataFrame with target institutions (optional)
+        institution_counts: Precomputed institution_name value counts (optional)
 
     Returns:
         Dictionary with success rate statistics
@@ -305,17 +319,17 @@ def calculate_scraping_success_rate(
 
     # Count unique institutions from contacts
     if 'institution_name' in contacts_df.columns:
-        institution_counts = contacts_df['institution_name'].value_counts()
+        if institution_counts is None:
+            institution_counts = contacts_df['institution_name'].value_counts()
         successful_institutions = len(institution_counts)
         avg_contacts = round(institution_counts.mean(), 1)
 
-        # Categorize institutions by contact count
-        contact_buckets = {
-            '1-2 contacts': ((institution_counts >= 1) & (institution_counts <= 2)).sum(),
-            '3-5 contacts': ((institution_counts >= 3) & (institution_counts <= 5)).sum(),
-            '6-10 contacts': ((institution_counts >= 6) & (institution_counts <= 10)).sum(),
-            '11+ contacts': (institution_counts >= 11).sum()
-        }
+        # Categorize institutions by contact count in one pass (bucket 0 = no contacts, not reported)
+        bucket_counts = np.bincount(
+            np.searchsorted(CONTACT_BUCKET_EDGES, institution_counts.to_numpy(), side='right'),
+            minlength=len(CONTACT_BUCKET_LABELS) + 1
+        )
+        contact_buckets = dict(zip(CONTACT_BUCKET_LABELS, bucket_counts[1:]))
     else:
         successful_institutions = 0
         avg_contacts = 0.0
@@ -378,9 +392,14 @@ def calculate_contact_statistics(
             }
         }
 
-    # Summary statistics
+    # Summary statistics (institution counts are shared with the success-rate pass)
     total_contacts = len(contacts_df)
-    total_institutions = contacts_df['institution_name'].nunique() if 'institution_name' in contacts_df.columns else 0
+    if 'institution_name' in contacts_df.columns:
+        institution_counts = contacts_df['institution_name'].value_counts()
+        total_institutions = int((institution_counts > 0).sum())
+    else:
+        institution_counts = None
+        total_institutions = 0
     avg_contacts = round(total_contacts / total_institutions, 1) if total_institutions > 0 else 0.0
 
     summary = {
@@ -397,7 +416,7 @@ def calculate_contact_statistics(
         'email_quality': get_email_quality_summary(contacts_df),
         'confidence_distribution': get_confidence_distribution(contacts_df),
         'top_roles': get_top_roles(contacts_df, top_n=10),
-        'scraping_success': calculate_scraping_success_rate(contacts_df, targets_df)
+        'scraping_success': calculate_scraping_success_rate(contacts_df, targets_df, institution_counts)
     }
 
     logger.info(f"Statistics calculation complete: {total_contacts} contacts from {total_institutions} institutions")
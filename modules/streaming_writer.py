@@ -10,17 +10,50 @@ Date: 2025-12-28
 Sprint: 3.2
 """
 
+import atexit
 import csv
 import json
+import os
+import weakref
+from functools import partial
 from pathlib import Path
 from typing import List, Dict, Optional
 from datetime import datetime
 import pandas as pd
+from pandas.api.types import is_scalar
 from modules.utils import setup_logger
 
+# Optional: orjson serializes the resume state in C, straight to bytes
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = setup_logger("streaming_writer")
 
 
+def _dumps(obj) -> bytes:
+    """Serialize to compact JSON bytes (orjson when installed)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def _loads(data: bytes):
+    """Parse JSON bytes (orjson when installed)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _checkpoint_at_exit(checkpoint_ref: weakref.WeakMethod):
+    """atexit hook: checkpoint the writer if it is still alive."""
+    checkpoint = checkpoint_ref()
+    if checkpoint is not None:
+        checkpoint()
+
+
 class StreamingContactWriter:
     """
     Writes contacts to disk incrementally as they're extracted.
@@ -32,13 +65,17 @@ class StreamingContactWriter:
     - Fault tolerance (partial results preserved on crash)
     """
 
-    def __init__(self, output_file: Path, resume_file: Optional[Path] = None):
+    # User-space buffer for the output CSV; flushed at each checkpoint and at exit
+    WRITE_BUFFER_SIZE = 4 * 1024 * 1024
+
+    def __init__(self, output_file: Path, resume_file: Optional[Path] = None, flush_every_n: int = 25):
         """
         Initialize streaming writer.
 
         Args:
             output_file: Path to CSV file for contacts (can be string or Path)
             resume_file: Path to JSON file tracking completed institutions (can be string or Path)
+            flush_every_n: Completed institutions per checkpoint (CSV flush + resume state save)
         """
         # Convert to Path objects if strings
         self.output_file = Path(output_file) if isinstance(output_file, str) else output_file
@@ -49,8 +86,21 @@ class StreamingContactWriter:
 
         self.contacts_written = 0
         self.institutions_completed = []
+        self._completed_set = set()  # Mirrors institutions_completed for O(1) lookups
         self.header_written = False
 
+        # Output CSV handle and row writer, opened on the first write_contacts call
+        self._file = None
+        self._writer: Optional[csv.DictWriter] = None
+
+        # Institutions completed since the last checkpoint; the rest is flushed at exit
+        self.flush_every_n = max(1, flush_every_n)
+        self._unsaved_completions = 0
+
+        # Exit hook holds only a weak reference, so unclosed writers can still be collected
+        self._exit_hook = partial(_checkpoint_at_exit, weakref.WeakMethod(self.checkpoint))
+        atexit.register(self._exit_hook)
+
         # Load resume state if exists
         self.load_resume_state()
 
@@ -58,9 +108,9 @@ class StreamingContactWriter:
         """Load resume state from disk."""
         if self.resume_file.exists():
             try:
-                with open(self.resume_file, 'r') as f:
-                    state = json.load(f)
+                state = _loads(self.resume_file.read_bytes())
                 self.institutions_completed = state.get('institutions_completed', [])
+                self._completed_set = set(self.institutions_completed)
                 self.contacts_written = state.get('contacts_written', 0)
                 logger.info(f"Loaded resume state: {len(self.institutions_completed)} institutions completed, "
                           f"{self.contacts_written} contacts written")
@@ -68,17 +118,28 @@ class StreamingContactWriter:
                 logger.error(f"Failed to load resume state: {e}")
 
     def save_resume_state(self):
-        """Save resume state to disk."""
+        """
+        Save resume state to disk.
+
+        The state is written and fsynced to a temporary file that then
+        replaces the resume file, so an interrupted save leaves the previous
+        state intact instead of a truncated file.
+        """
+        tmp_file = self.resume_file.with_name(self.resume_file.name + '.tmp')
         try:
             state = {
                 'institutions_completed': self.institutions_completed,
                 'contacts_written': self.contacts_written,
                 'last_updated': datetime.now().isoformat(),
             }
-            with open(self.resume_file, 'w') as f:
-                json.dump(state, f, indent=2)
+            with open(tmp_file, 'wb') as f:
+                f.write(_dumps(state))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.resume_file)
         except Exception as e:
             logger.error(f"Failed to save resume state: {e}")
+            tmp_file.unlink(missing_ok=True)
 
     def is_institution_completed(self, institution_name: str) -> bool:
         """
@@ -90,7 +151,7 @@ class StreamingContactWriter:
         Returns:
             True if already completed
         """
-        return institution_name in self.institutions_completed
+        return institution_name in self._completed_set
 
     def write_contacts(self, contacts: List[Dict], institution_name: str):
         """
@@ -105,21 +166,15 @@ class StreamingContactWriter:
             return
 
         try:
-            # Convert to DataFrame
-            df = pd.DataFrame(contacts)
-
-            # Determine if we need to write header
-            write_header = not self.output_file.exists() or not self.header_written
-
-            # Append to CSV
-            df.to_csv(
-                self.output_file,
-                mode='a',
-                header=write_header,
-                index=False
+            if self._writer is None:
+                self._open_writer(list(contacts[0]))
+
+            # Missing values are written as empty fields, as DataFrame.to_csv did
+            self._writer.writerows(
+                {key: '' if is_scalar(value) and pd.isna(value) else value for key, value in contact.items()}
+                for contact in contacts
             )
 
-            self.header_written = True
             self.contacts_written += len(contacts)
 
             logger.info(f"Wrote {len(contacts)} contacts for {institution_name} "
@@ -129,6 +184,30 @@ class StreamingContactWriter:
             logger.error(f"Failed to write contacts for {institution_name}: {e}")
             raise
 
+    def _open_writer(self, fieldnames: List[str]):
+        """
+        Open the output CSV for appending and create the row writer.
+
+        The header is written only when the file is new or empty; otherwise
+        rows keep the column order of the existing header.
+
+        Args:
+            fieldnames: Column order for a new file, taken from the first contact written
+        """
+        write_header = not self.output_file.exists() or self.output_file.stat().st_size == 0
+        if not write_header:
+            with open(self.output_file, 'r', newline='', encoding='utf-8') as f:
+                fieldnames = next(csv.reader(f))
+
+        self._file = open(self.output_file, 'a', newline='', encoding='utf-8', buffering=self.WRITE_BUFFER_SIZE)
+        self._writer = csv.DictWriter(
+            self._file, fieldnames=fieldnames, restval='', extrasaction='ignore', lineterminator='\n'
+        )
+
+        if write_header:
+            self._writer.writeheader()
+        self.header_written = True
+
     def mark_institution_completed(self, institution_name: str):
         """
         Mark institution as completed.
@@ -136,11 +215,30 @@ class StreamingContactWriter:
         Args:
             institution_name: Name of institution
         """
-        if institution_name not in self.institutions_completed:
+        if institution_name not in self._completed_set:
+            self._completed_set.add(institution_name)
             self.institutions_completed.append(institution_name)
-            self.save_resume_state()
+            self._unsaved_completions += 1
             logger.debug(f"Marked {institution_name} as completed")
 
+            if self._unsaved_completions >= self.flush_every_n:
+                self.checkpoint()
+
+    def checkpoint(self):
+        """
+        Flush buffered contacts and save the resume state.
+
+        Rows reach the CSV before their institutions are recorded as done,
+        so a resumed run never skips an institution whose contacts were lost.
+        Called every flush_every_n completed institutions and at exit.
+        """
+        if self._file is not None:
+            self._file.flush()
+
+        if self._unsaved_completions:
+            self.save_resume_state()
+            self._unsaved_completions = 0
+
     def get_stats(self) -> dict:
         """
         Get writer statistics.
@@ -155,6 +253,20 @@ class StreamingContactWriter:
             'output_size_kb': self.output_file.stat().st_size / 1024 if self.output_file.exists() else 0,
         }
 
+    def close(self):
+        """
+        Checkpoint, close the output CSV and remove the exit hook.
+
+        The resume state is kept, so a later run can resume from it.
+        """
+        self.checkpoint()
+        atexit.unregister(self._exit_hook)
+
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._writer = None
+
     def finalize(self):
         """
         Finalize writing and clean up resume state.
@@ -162,6 +274,10 @@ class StreamingContactWriter:
         logger.info(f"Finalizing: {self.contacts_written} contacts written, "
                    f"{len(self.institutions_completed)} institutions completed")
 
+        # Nothing left to save once the resume state is removed
+        self._unsaved_completions = 0
+        self.close()
+
         # Clean up resume file
         if self.resume_file.exists():
             try:
@@ -215,8 +331,9 @@ def test_streaming_writer():
     writer.mark_institution_completed('Institution B')
     print(f"  Stats: {writer.get_stats()}")
 
-    # Test 3: Resume functionality
+    # Test 3: Resume functionality (close the first writer as an interrupted run would)
     print("\nTest 3: Testing resume functionality")
+    writer.close()
     writer2 = StreamingContactWriter(output_file, resume_file)
     print(f"  Loaded resume state: {len(writer2.institutions_completed)} institutions")
     print(f"  Is 'Institution A' completed? {writer2.is_institution_completed('Institution A')}")
@@ -7,10 +7,12 @@ Provides logging setup, caching, rate limiting, and common helper functions.
 import time
 import re
 import sys
+import asyncio
+import threading
 from pathlib import Path
-from functools import wraps
+from functools import wraps, lru_cache
 from datetime import datetime, timedelta
-from typing import Optional, Callable, Any
+from typing import Optional, Callable, Any, List
 from urllib.parse import urlparse, urljoin
 
 import pandas as pd
@@ -116,6 +118,77 @@ def rate_limit(calls: int = 1, period: float = 1.0):
     return decorator
 
 
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter.
+
+    Unlike rate_limit, which forces a fixed gap between every call, the bucket
+    allows bursts of up to `burst` calls and then refills at `rate` tokens per
+    second. One bucket can be shared by many threads or coroutines so they draw
+    from a single global budget without idle time.
+
+    Example:
+        bucket = TokenBucket(rate=10, burst=20)  # 10 calls/s, bursts of 20
+        bucket.acquire()
+        call_api()
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Initialize token bucket.
+
+        Args:
+            rate: Tokens added per second
+            burst: Maximum tokens held (calls allowed back to back)
+        """
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.last_refill = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """
+        Take one token, going into debt if the bucket is empty.
+
+        Returns:
+            Seconds the caller must wait before its token is available
+        """
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+            self.last_refill = now
+            self.tokens -= 1
+
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+    def acquire(self) -> float:
+        """
+        Block until a token is available (synchronous version).
+
+        Returns:
+            Seconds waited
+        """
+        wait_time = self._reserve()
+        if wait_time > 0:
+            time.sleep(wait_time)
+        return wait_time
+
+    async def acquire_async(self) -> float:
+        """
+        Wait until a token is available without blocking the event loop.
+
+        Returns:
+            Seconds waited
+        """
+        wait_time = self._reserve()
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+        return wait_time
+
+
 def adaptive_delay(
     base_delay: float,
     success_rate: float,
@@ -285,10 +358,14 @@ def normalize_url(url: str) -> str:
     return url
 
 
+@lru_cache(maxsize=4096)
 def extract_domain(url: str) -> str:
     """
     Extract domain from URL.
 
+    Memoized: contacts at the same institution share URLs, so repeated
+    lookups skip normalize_url/urlparse.
+
     Args:
         url: URL to extract domain from
 
@@ -299,6 +376,49 @@ def extract_domain(url: str) -> str:
     return parsed.netloc
 
 
+@lru_cache(maxsize=8192)
+def url_netloc(url: str) -> str:
+    """
+    Lower-cased network location of an already absolute URL.
+
+    Memoized for the fetch router and link scorer, which look up the
+    host of the same URLs many times per page and per crawl.
+
+    Args:
+        url: URL to parse
+
+    Returns:
+        Lower-cased netloc (the whole lower-cased input if it cannot be parsed)
+    """
+    try:
+        return urlparse(url).netloc.lower()
+    except ValueError:
+        return url.lower()
+
+
+def compile_ordered_union(patterns: List[str], prefix: str = 'g') -> re.Pattern:
+    """
+    Compile patterns into one regex that reports the first pattern (in list
+    order) found anywhere in the string.
+
+    Each branch is a lookahead anchored at the start, so alternatives are
+    tried in list order rather than by leftmost match position, matching a
+    "for pattern in patterns: if re.search(...)" loop in a single call.
+
+    Args:
+        patterns: Regex patterns, highest priority first
+        prefix: Named-group prefix; group f"{prefix}{N}" marks pattern N
+
+    Returns:
+        Compiled pattern to use with .match(); int(m.lastgroup[len(prefix):])
+        is the index of the winning pattern
+    """
+    branches = "|".join(
+        f"(?=.*?(?P<{prefix}{i}>{pattern}))" for i, pattern in enumerate(patterns)
+    )
+    return re.compile(f"(?:{branches})", re.DOTALL)
+
+
 # =============================================================================
 # Text Processing
 # =============================================================================
@@ -426,6 +546,7 @@ def get_timestamp() -> str:
 __all__ = [
     'setup_logger',
     'rate_limit',
+    'TokenBucket',
     'adaptive_delay',
     'cache_to_file',
     'load_cached_file',
@@ -433,6 +554,8 @@ __all__ = [
     'validate_url',
     'normalize_url',
     'extract_domain',
+    'url_netloc',
+    'compile_ordered_union',
     'clean_text',
     'extract_email',
     'extract_phone',
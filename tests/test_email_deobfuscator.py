@@ -0,0 +1,111 @@
+"""
+Tests for email de-obfuscation.
+"""
+
+import pytest
+
+from modules import email_deobfuscator
+from modules.email_deobfuscator import EmailDeobfuscator
+
+
+def encode_cloudflare(email: str, key: int = 0x42) -> str:
+    """Encode an email the way Cloudflare's data-cfemail attribute does."""
+    return f"{key:02x}" + ''.join(f"{ord(c) ^ key:02x}" for c in email)
+
+
+@pytest.fixture
+def deobfuscator():
+    """Fresh de-obfuscator with zeroed stats."""
+    return EmailDeobfuscator()
+
+
+# =============================================================================
+# Text Pattern Tests
+# =============================================================================
+
+def test_deobfuscate_single_patterns(deobfuscator):
+    """Test [at]/(at)/AT and [dot]/(dot)/DOT variants."""
+    assert deobfuscator.deobfuscate_single('jdoe(at)law(dot)edu') == 'jdoe@law.edu'
+    assert deobfuscator.deobfuscate_single('jdoe[at]law[dot]edu') == 'jdoe@law.edu'
+    assert deobfuscator.deobfuscate_single('jdoe AT law DOT edu') == 'jdoe@law.edu'
+    assert deobfuscator.deobfuscate_single('jdoe[AT]law[DOT]edu') == 'jdoe@law.edu'
+    assert deobfuscator.deobfuscate_single('jdoe(At)law(Dot)edu') == 'jdoe@law.edu'
+    assert deobfuscator.deobfuscate_single('not an email') is None
+    assert deobfuscator.deobfuscate_single('') is None
+
+
+def test_text_patterns_skip_plain_emails(deobfuscator):
+    """Test that emails already in clear text are not counted as decoded."""
+    html = '<p>pete AT harvard DOT edu</p><p>plain@school.edu</p>'
+    assert deobfuscator.deobfuscate_all(html) == {'pete@harvard.edu'}
+    assert deobfuscator.get_stats()['text_pattern_decoded'] == 1
+
+
+# =============================================================================
+# HTML Source Tests
+# =============================================================================
+
+def test_cloudflare_decoding(deobfuscator):
+    """Test data-cfemail XOR decoding, including malformed values."""
+    html = (
+        f'<a data-cfemail="{encode_cloudflare("jane.doe@law.edu")}">[email protected]</a>'
+        f'<span data-cfemail="{encode_cloudflare("bob@school.org", 0x11)}"></span>'
+        '<span data-cfemail="zz"></span>'
+    )
+    assert deobfuscator.deobfuscate_all(html) == {'jane.doe@law.edu', 'bob@school.org'}
+    assert deobfuscator.get_stats()['cloudflare_decoded'] == 2
+
+
+def test_script_noscript_and_attributes(deobfuscator):
+    """Test JavaScript literals/concatenation, noscript, and data attributes."""
+    html = (
+        '<script>var e = "js.user@uni.edu"; var f = "abc" + "@" + "def.org";</script>'
+        '<noscript>nos@cript.edu</noscript>'
+        '<div data-email="attr@school.edu" data-contact="nope"></div>'
+    )
+    assert deobfuscator.deobfuscate_all(html) == {
+        'js.user@uni.edu', 'abc@def.org', 'nos@cript.edu', 'attr@school.edu'
+    }
+
+
+def test_false_positives_rejected(deobfuscator):
+    """Test placeholder addresses are filtered out."""
+    assert deobfuscator._is_valid_email_format('email@example.com') is False
+    assert deobfuscator._is_valid_email_format('a@b') is False
+    assert deobfuscator._is_valid_email_format('jdoe@law.edu') is True
+
+
+def test_email_format_rejects_pipe_and_long_input(deobfuscator):
+    """Test the TLD class no longer accepts '|' and long inputs fail fast."""
+    assert deobfuscator._is_valid_email_format('jdoe@law.ed|u') is False
+    assert deobfuscator._is_valid_email_format('a@' + 'a.' * 5000 + 'com') is False
+
+
+def test_marker_scan_fallback_matches(deobfuscator, monkeypatch):
+    """Test results are the same with and without the RE2 marker scan."""
+    html = (
+        f'<a data-cfemail="{encode_cloudflare("jane.doe@law.edu")}"></a>'
+        '<p>pete AT harvard DOT edu</p><noscript>nos@cript.edu</noscript>'
+    )
+    expected = deobfuscator.deobfuscate_all(html)
+
+    monkeypatch.setattr(email_deobfuscator, '_MARKER_SET', None)
+    assert EmailDeobfuscator().deobfuscate_all(html) == expected
+    assert EmailDeobfuscator().deobfuscate_all('<p>nothing here</p>') == set()
+
+
+def test_text_marker_needs_email_shape(monkeypatch):
+    """Test plain prose does not trigger the text decoder, with and without RE2."""
+    prose = '<p>Visit the law school at our campus. Office hours at 9 a.m.</p>'
+    obfuscated = ['jdoe AT law DOT edu', 'jdoe[at]law-school.edu', 'jdoe@law(dot)edu']
+
+    for marker_set in (email_deobfuscator._MARKER_SET, None):
+        monkeypatch.setattr(email_deobfuscator, '_MARKER_SET', marker_set)
+        assert 'text' not in email_deobfuscator._find_markers(prose)
+        for html in obfuscated:
+            assert 'text' in email_deobfuscator._find_markers(html)
+
+
+def test_empty_html(deobfuscator):
+    """Test empty input returns no emails."""
+    assert deobfuscator.deobfuscate_all('') == set()
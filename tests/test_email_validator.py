@@ -11,9 +11,11 @@ Test Coverage:
 - Score mapping and status normalization
 """
 
+import asyncio
+
 import pytest
 import pandas as pd
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch, MagicMock, AsyncMock
 import requests
 
 from modules.email_validator import (
@@ -21,6 +23,7 @@ from modules.email_validator import (
     validate_email_neverbounce,
     validate_email_auto,
     batch_validate_emails,
+    batch_validate_emails_async,
     find_missing_emails,
     enrich_contact_data,
     is_catchall_domain,
@@ -28,6 +31,9 @@ from modules.email_validator import (
     _map_zerobounce_score,
     _map_neverbounce_status,
     _map_neverbounce_score,
+    _validate_email_auto_cached,
+    validate_unique_emails,
+    _CREDITS_CACHE,
 )
 
 
@@ -35,6 +41,15 @@ from modules.email_validator import (
 # Test Fixtures - Mock API Responses
 # ============================================================================
 
+@pytest.fixture(autouse=True)
+def isolated_validation_cache(tmp_path, monkeypatch):
+    """Keep the persisted validation cache out of the real cache directory."""
+    cache_file = tmp_path / 'email_validation_cache.csv'
+    monkeypatch.setattr('modules.email_validator.VALIDATION_CACHE_FILE', cache_file)
+    monkeypatch.setattr('modules.email_validator.ENABLE_CACHING', True)
+    return cache_file
+
+
 @pytest.fixture
 def mock_zerobounce_valid():
     """Mock ZeroBounce API response for valid email."""
@@ -215,7 +230,7 @@ class TestScoreMapping:
 class TestZeroBounceValidation:
     """Test ZeroBounce email validation."""
 
-    @patch('modules.email_validator.requests.get')
+    @patch('modules.email_validator.ZEROBOUNCE_SESSION.get')
     def test_validate_valid_email(self, mock_get, mock_zerobounce_valid):
         """Test validating a valid email with ZeroBounce."""
         # Mock API response
@@ -234,7 +249,7 @@ class TestZeroBounceValidation:
         assert result['is_catchall'] is False
         assert result['service'] == 'zerobounce'
 
-    @patch('modules.email_validator.requests.get')
+    @patch('modules.email_validator.ZEROBOUNCE_SESSION.get')
     def test_validate_invalid_email(self, mock_get, mock_zerobounce_invalid):
         """Test validating an invalid email with ZeroBounce."""
         # Mock API response
@@ -250,7 +265,7 @@ class TestZeroBounceValidation:
         assert result['status'] == 'invalid'
         assert result['score'] == 0
 
-    @patch('modules.email_validator.requests.get')
+    @patch('modules.email_validator.ZEROBOUNCE_SESSION.get')
     def test_validate_catchall_email(self, mock_get, mock_zerobounce_catchall):
         """Test validating a catch-all domain with ZeroBounce."""
         # Mock API response
@@ -272,7 +287,7 @@ class TestZeroBounceValidation:
         result = validate_email_zerobounce('test@example.com', api_key=None)
         assert result is None
 
-    @patch('modules.email_validator.requests.get')
+    @patch('modules.email_validator.ZEROBOUNCE_SESSION.get')
     def test_validate_api_timeout(self, mock_get):
         """Test handling of API timeout."""
         mock_get.side_effect = requests.exceptions.Timeout()
@@ -280,7 +295,7 @@ class TestZeroBounceValidation:
         result = validate_email_zerobounce('test@example.com', api_key='test_key')
         assert result is None
 
-    @patch('modules.email_validator.requests.get')
+    @patch('modules.email_validator.ZEROBOUNCE_SESSION.get')
     def test_validate_api_error(self, mock_get):
         """Test handling of API error response."""
         mock_response = Mock()
@@ -299,7 +314,7 @@ class TestZeroBounceValidation:
 class TestNeverBounceValidation:
     """Test NeverBounce email validation."""
 
-    @patch('modules.email_validator.requests.post')
+    @patch('modules.email_validator.NEVERBOUNCE_SESSION.post')
     def test_validate_valid_email(self, mock_post, mock_neverbounce_valid):
         """Test validating a valid email with NeverBounce."""
         # Mock API response
@@ -318,7 +333,7 @@ class TestNeverBounceValidation:
         assert result['is_catchall'] is False
         assert result['service'] == 'neverbounce'
 
-    @patch('modules.email_validator.requests.post')
+    @patch('modules.email_validator.NEVERBOUNCE_SESSION.post')
     def test_validate_invalid_email(self, mock_post, mock_neverbounce_invalid):
         """Test validating an invalid email with NeverBounce."""
         # Mock API response
@@ -334,7 +349,7 @@ class TestNeverBounceValidation:
         assert result['status'] == 'invalid'
         assert result['score'] == 0
 
-    @patch('modules.email_validator.requests.post')
+    @patch('modules.email_validator.NEVERBOUNCE_SESSION.post')
     def test_validate_catchall_email(self, mock_post, mock_neverbounce_catchall):
         """Test validating a catch-all domain with NeverBounce."""
         # Mock API response
@@ -356,7 +371,7 @@ class TestNeverBounceValidation:
         result = validate_email_neverbounce('test@example.com', api_key=None)
         assert result is None
 
-    @patch('modules.email_validator.requests.post')
+    @patch('modules.email_validator.NEVERBOUNCE_SESSION.post')
     def test_validate_api_failed_status(self, mock_post):
         """Test handling of failed API status."""
         mock_response = Mock()
@@ -371,6 +386,31 @@ class TestNeverBounceValidation:
         assert result is None
 
 
+# ============================================================================
+# Test Auto Validation Cache
+# ============================================================================
+
+class TestAutoValidationCache:
+    """Test validate_email_auto memoization."""
+
+    @patch('modules.email_validator.validate_email_neverbounce')
+    def test_repeat_emails_hit_cache(self, mock_neverbounce):
+        """Test repeats skip the API and keep the caller's spelling."""
+        _validate_email_auto_cached.cache_clear()
+        mock_neverbounce.return_value = {
+            'email': 'cached@law.edu', 'status': 'valid', 'score': 100,
+            'is_catchall': False, 'is_disposable': False, 'service': 'neverbounce'
+        }
+
+        first = validate_email_auto('cached@law.edu')
+        second = validate_email_auto(' Cached@Law.edu ')
+
+        assert mock_neverbounce.call_count == 1
+        assert first['status'] == second['status'] == 'valid'
+        assert second['email'] == ' Cached@Law.edu '
+        _validate_email_auto_cached.cache_clear()
+
+
 # ============================================================================
 # Test Batch Validation
 # ============================================================================
@@ -381,12 +421,13 @@ class TestBatchValidation:
     @patch('modules.email_validator.validate_email_auto')
     def test_batch_validate_multiple_emails(self, mock_validate):
         """Test batch validation of multiple emails."""
-        # Mock validation results
-        mock_validate.side_effect = [
-            {'email': 'test1@example.com', 'status': 'valid', 'score': 100, 'is_catchall': False, 'is_disposable': False, 'service': 'neverbounce'},
-            {'email': 'test2@example.com', 'status': 'invalid', 'score': 0, 'is_catchall': False, 'is_disposable': False, 'service': 'neverbounce'},
-            {'email': 'test3@example.com', 'status': 'catch-all', 'score': 70, 'is_catchall': True, 'is_disposable': False, 'service': 'zerobounce'},
-        ]
+        # Mock validation results (keyed by email - calls run on a thread pool)
+        results = {
+            'test1@example.com': {'email': 'test1@example.com', 'status': 'valid', 'score': 100, 'is_catchall': False, 'is_disposable': False, 'service': 'neverbounce'},
+            'test2@example.com': {'email': 'test2@example.com', 'status': 'invalid', 'score': 0, 'is_catchall': False, 'is_disposable': False, 'service': 'neverbounce'},
+            'test3@example.com': {'email': 'test3@example.com', 'status': 'catch-all', 'score': 70, 'is_catchall': True, 'is_disposable': False, 'service': 'zerobounce'},
+        }
+        mock_validate.side_effect = results.get
 
         emails = ['test1@example.com', 'test2@example.com', 'test3@example.com']
         result_df = batch_validate_emails(emails, service='auto')
@@ -416,6 +457,50 @@ class TestBatchValidation:
         # Should only validate non-empty emails
         assert len(result_df) == 2
 
+    @patch('modules.email_validator.validate_email_auto_async', new_callable=AsyncMock)
+    def test_batch_validate_async(self, mock_validate):
+        """Test async batch validation keeps input order and fills failures."""
+        def fake_validate(client, email):
+            if email == 'missing@example.com':
+                return None
+            return {'email': email, 'status': 'valid', 'score': 100, 'is_catchall': False, 'is_disposable': False, 'service': 'neverbounce'}
+
+        mock_validate.side_effect = fake_validate
+
+        emails = ['test1@example.com', None, 'missing@example.com', '', 'test2@example.com']
+        result_df = asyncio.run(batch_validate_emails_async(emails, concurrency=2))
+
+        assert result_df['email'].tolist() == ['test1@example.com', 'missing@example.com', 'test2@example.com']
+        assert result_df['status'].tolist() == ['valid', 'unknown', 'valid']
+        assert result_df.iloc[1]['service'] == 'none'
+
+
+# ============================================================================
+# Test Validation Cache
+# ============================================================================
+
+class TestValidationCache:
+    """Test de-duplicated, persisted validation."""
+
+    @patch('modules.email_validator.batch_validate_emails')
+    def test_unique_emails_validated_once_and_cached(self, mock_batch, isolated_validation_cache):
+        """Test duplicates are sent once and cached results are reused next run."""
+        mock_batch.side_effect = lambda emails, service: pd.DataFrame([
+            {'email': e, 'status': 'valid', 'score': 100, 'is_catchall': False,
+             'is_disposable': False, 'service': 'neverbounce'}
+            for e in emails
+        ])
+
+        first = validate_unique_emails(['a@law.edu', 'a@law.edu', 'b@law.edu'])
+        assert mock_batch.call_args[0][0] == ['a@law.edu', 'b@law.edu']
+        assert len(first) == 2
+        assert isolated_validation_cache.exists()
+
+        second = validate_unique_emails(['A@Law.edu', 'c@law.edu'])
+        assert mock_batch.call_args[0][0] == ['c@law.edu']
+        assert list(second['email']) == ['A@Law.edu', 'c@law.edu']
+        assert second.iloc[0]['status'] == 'valid'
+
 
 # ============================================================================
 # Test Catch-all Detection
@@ -540,6 +625,7 @@ class TestContactEnrichment:
         assert 'email_status' in result_df.columns
         assert 'email_score' in result_df.columns
         assert 'email_is_catchall' in result_df.columns
+        assert isinstance(result_df['email_status'].dtype, pd.CategoricalDtype)
 
         # Should have updated confidence scores (+30 for valid emails)
         assert result_df.iloc[0]['confidence_score'] == 80
@@ -592,7 +678,14 @@ class TestContactEnrichment:
 class TestCreditManagement:
     """Test API credit checking."""
 
-    @patch('modules.email_validator.requests.get')
+    @pytest.fixture(autouse=True)
+    def clear_credits_cache(self):
+        """Start every test without cached credit checks."""
+        _CREDITS_CACHE.clear()
+        yield
+        _CREDITS_CACHE.clear()
+
+    @patch('modules.email_validator.ZEROBOUNCE_SESSION.get')
     def test_check_zerobounce_credits(self, mock_get):
         """Test checking ZeroBounce credits."""
         mock_response = Mock()
@@ -608,10 +701,25 @@ class TestCreditManagement:
         credits = check_zerobounce_credits(api_key=None)
         assert credits is None
 
-    @patch('modules.email_validator.requests.get')
+    @patch('modules.email_validator.ZEROBOUNCE_SESSION.get')
     def test_check_credits_api_error(self, mock_get):
         """Test handling of API error when checking credits."""
         mock_get.side_effect = requests.exceptions.RequestException()
 
         credits = check_zerobounce_credits(api_key='test_key')
         assert credits is None
+
+    @patch('modules.email_validator.ZEROBOUNCE_SESSION.get')
+    def test_check_credits_cached_within_ttl(self, mock_get):
+        """Test repeated credit checks reuse the cached answer per key."""
+        mock_response = Mock()
+        mock_response.json.return_value = {'Credits': '42'}
+        mock_response.raise_for_status = Mock()
+        mock_get.return_value = mock_response
+
+        assert check_zerobounce_credits(api_key='test_key') == 42
+        assert check_zerobounce_credits(api_key='test_key') == 42
+        assert mock_get.call_count == 1
+
+        check_zerobounce_credits(api_key='other_key')
+        assert mock_get.call_count == 2
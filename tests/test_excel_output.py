@@ -159,6 +159,25 @@ class TestCreateExcelWorkbook:
         finally:
             Path(temp_path).unlink()
 
+    def test_xlsxwriter_engine_matches_openpyxl(self, sample_contacts, sample_stats, sample_targets):
+        """Test the constant-memory xlsxwriter engine writes the same cells."""
+        pytest.importorskip('xlsxwriter')
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            paths = {engine: str(Path(tmp_dir) / f"{engine}.xlsx") for engine in ('openpyxl', 'xlsxwriter')}
+            for engine, path in paths.items():
+                assert create_excel_workbook(sample_contacts, sample_stats, path, sample_targets, engine=engine)
+
+            expected = load_workbook(paths['openpyxl'])
+            actual = load_workbook(paths['xlsxwriter'])
+            assert actual.sheetnames == expected.sheetnames
+            for name in expected.sheetnames:
+                assert list(actual[name].values) == list(expected[name].values), name
+
+            ws = actual['All Contacts']
+            assert ws.freeze_panes == 'A2'
+            assert ws.auto_filter.ref == expected['All Contacts'].auto_filter.ref
+            assert len(ws.conditional_formatting) == 1
+
     def test_all_contacts_sheet_content(self, sample_contacts, sample_stats):
         """Test that All Contacts sheet contains all contacts."""
         with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as f:
@@ -325,19 +344,42 @@ class TestExcelFormatting:
             confidence_col = headers.index('confidence_score') + 1 if 'confidence_score' in headers else None
 
             if confidence_col:
-                # Check row 2 (John Doe, score 80) should be green (high confidence)
-                cell = ws.cell(row=2, column=1)
-                # openpyxl uses '00' as alpha channel prefix
-                assert cell.fill.start_color.rgb == '00' + COLORS['high']
+                # Rows are colored by conditional formatting rules over the data range
+                rules = [
+                    (str(cf.sqref), rule)
+                    for cf in ws.conditional_formatting
+                    for rule in cf.rules
+                ]
+                assert len(rules) == 3
+                assert all(sqref.startswith('A2:') for sqref, _ in rules)
 
-                # Check row 4 (Bob Johnson, score 45) should be red (low confidence)
-                cell = ws.cell(row=4, column=1)
-                assert cell.fill.start_color.rgb == '00' + COLORS['low']
+                # openpyxl uses '00' as alpha channel prefix
+                fills = [rule.dxf.fill.start_color.rgb for _, rule in rules]
+                assert fills == ['00' + COLORS['high'], '00' + COLORS['medium'], '00' + COLORS['low']]
+                assert '>=75' in rules[0][1].formula[0]
+                assert '<50' in rules[2][1].formula[0]
 
         finally:
             Path(temp_path).unlink()
 
 
+    def test_auto_fit_columns_from_dataframe(self):
+        """Test DataFrame-based widths match the cell-walk widths."""
+        from openpyxl import Workbook
+        from openpyxl.utils.dataframe import dataframe_to_rows
+
+        df = pd.DataFrame({'name': ['Al', 'A much longer name'], 'score': [5, None]})
+        widths = []
+        for source in (None, df):
+            ws = Workbook().active
+            for row in dataframe_to_rows(df, index=False, header=True):
+                ws.append(row)
+            auto_fit_columns(ws, df=source)
+            widths.append((ws.column_dimensions['A'].width, ws.column_dimensions['B'].width))
+
+        assert widths[0] == widths[1] == (20, 7)
+
+
 class TestEmptyDataHandling:
     """Test handling of empty data."""
 
@@ -11,12 +11,15 @@ from modules.utils import (
     validate_url,
     normalize_url,
     extract_domain,
+    url_netloc,
+    compile_ordered_union,
     clean_text,
     extract_email,
     extract_phone,
     parse_name,
     adaptive_delay,
     rate_limit,
+    TokenBucket,
 )
 
 
@@ -47,6 +50,22 @@ def test_extract_domain():
     assert extract_domain('example.com') == 'example.com'
 
 
+def test_url_netloc():
+    """Test lower-cased netloc extraction, including unparseable input."""
+    assert url_netloc('https://Law.Stanford.EDU/Directory') == 'law.stanford.edu'
+    assert url_netloc('mailto:jdoe@law.edu') == ''
+    assert url_netloc('http://[::1') == 'http://[::1'
+
+
+def test_compile_ordered_union_prefers_list_order():
+    """Test the first pattern in list order wins, not the leftmost match."""
+    pattern = compile_ordered_union([r'/profile/[^/]+$', r'/staff/[^/]+/[^/]+$', r'/\d+$'])
+    assert pattern.match('/staff/profile/jane').lastgroup == 'g0'
+    assert pattern.match('/staff/team/42').lastgroup == 'g1'
+    assert pattern.match('/news/42').lastgroup == 'g2'
+    assert pattern.match('/news') is None
+
+
 # =============================================================================
 # Text Processing Tests
 # =============================================================================
@@ -109,6 +128,20 @@ def test_rate_limit_decorator():
     assert call_times[2] - call_times[1] >= 0.4
 
 
+def test_token_bucket():
+    """Test token bucket allows a burst, then paces at the refill rate."""
+    bucket = TokenBucket(rate=10, burst=3)
+
+    # Burst of 3 goes through immediately
+    assert [bucket.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+
+    # Next token needs ~0.1s of refill
+    start = time.monotonic()
+    waited = bucket.acquire()
+    assert waited > 0.05
+    assert time.monotonic() - start >= 0.05
+
+
 def test_adaptive_delay():
     """Test adaptive delay calculation."""
     # Good performance - should speed up